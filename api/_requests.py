@@ -18,6 +18,9 @@ class TaskStatus(str, Enum):
     FAILED = "failed"
 
 
+# Resolves exact status strings with a dict lookup; anything else still goes
+# through TaskStatus(v.lower()) in the validator below.
+_TASK_STATUS_BY_VALUE: dict[str, TaskStatus] = {status.value: status for status in TaskStatus}
 
 
 class ImageInfo(BaseModel):
@@ -57,5 +60,6 @@ class TaskInfo(BaseModel):
     def validate_task_status(cls, v: Any) -> TaskStatus:
         """Convert string status to TaskStatus enum."""
         if isinstance(v, str):
-            return TaskStatus(v.lower())
+            status = _TASK_STATUS_BY_VALUE.get(v)
+            return status if status is not None else TaskStatus(v.lower())
         return v
@@ -10,6 +10,7 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime
 
+import orjson
 from pydantic import ValidationError
 
 from ...client import KlingClient
@@ -100,7 +101,7 @@ class ImageToVideoAPI:
         try:
             resp = await self._http.get(f"{self.base_url}/v1/videos/image2video", params=params)
             resp.raise_for_status()
-            return TaskListResponse(**resp.json())
+            return TaskListResponse.model_validate(orjson.loads(resp.content))
         except Exception as exc:
             raise handle_api_error(exc) from exc
 
@@ -154,12 +154,12 @@ class TestListTasks:
         # Mock the response
         mock_response = AsyncMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "data": [task_data],
             "total": 1,
             "limit": 10,
             "offset": 0,
-        }
+        }).encode()
         mock_client.get.return_value = mock_response
 
         # Call the method
@@ -8,6 +8,7 @@ import logging
 from typing import Any
 
 import httpx
+import orjson
 from pydantic import ValidationError
 from tenacity import (
     retry,
@@ -204,7 +205,7 @@ class LipSyncAPI:
             response.raise_for_status()
 
             # Parse and return the response
-            return TaskListResponse.model_validate(response.json())
+            return TaskListResponse.model_validate(orjson.loads(response.content))
 
         except Exception as e:
             logger.error("Error listing tasks: %s", e)
@@ -106,7 +106,8 @@ class MultiImageToVideoAPI:
             MultiImageToVideoAPIError: For other API errors
         """
         import asyncio
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
         while True:
             try:
                 status = await self.get_status(task_id)
@@ -118,7 +119,7 @@ class MultiImageToVideoAPI:
                         f"Task {task_id} failed: {getattr(status, 'task_status_msg', 'No details')}"
                     )
                 return status
-            if timeout is not None and (asyncio.get_event_loop().time() - start_time) > timeout:
+            if deadline is not None and loop.time() > deadline:
                 raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds")
             await asyncio.sleep(poll_interval)
 
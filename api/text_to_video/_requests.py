@@ -9,7 +9,8 @@ from enum import Enum
 from typing import Any, Literal
 
 import httpx
-from pydantic import BaseModel, Field, HttpUrl, validator
+import orjson
+from pydantic import BaseModel, Field, HttpUrl, model_validator
 
 from ...config import KlingConfig
 from ._exceptions import (
@@ -80,13 +81,16 @@ class CameraConfig(BaseModel):
         description="Focal length change (field of view)"
     )
 
-    @validator('*', pre=True)
-    def validate_config(cls, v, field):
+    @model_validator(mode='after')
+    def validate_config(self) -> CameraConfig:
         """Ensure only one camera parameter is set when using simple type."""
-        if v != 0 and field.name != 'horizontal':  # Skip validation for the current field
-            if any(v != 0 for v in cls.__annotations__.values() if v != field.name):
-                raise ValueError("Only one camera parameter should be non-zero")
-        return v
+        non_zero = [
+            name for name in type(self).model_fields
+            if getattr(self, name) not in (None, 0)
+        ]
+        if len(non_zero) > 1:
+            raise ValueError("Only one camera parameter should be non-zero")
+        return self
 
 
 class CameraControl(BaseModel):
@@ -100,12 +104,12 @@ class CameraControl(BaseModel):
         description="Camera movement configuration"
     )
 
-    @validator('config')
-    def validate_config_type(cls, v, values):
+    @model_validator(mode='after')
+    def validate_config_type(self) -> CameraControl:
         """Validate config based on camera control type."""
-        if values.get('type') == CameraControlType.SIMPLE and v is None:
+        if self.type == CameraControlType.SIMPLE and self.config is None:
             raise ValueError("Config is required for simple camera control type")
-        return v
+        return self
 
 
 class TextToVideoRequest(BaseModel):
@@ -182,12 +186,16 @@ class KlingAPITextToVideoClient:
         """Initialize the client with configuration."""
         self.config = config
         self.base_url = config.base_url.rstrip("/")
+        self._tasks_url = f"{self.base_url}/v1/videos/text2video"
+        self._task_url_prefix = f"{self._tasks_url}/"
         self.timeout = httpx.Timeout(timeout=config.timeout)
-        self.headers = {
+        # Encoded once and installed as client defaults, so create, status and
+        # list requests all send them without any per-request header merge.
+        self.headers = httpx.Headers({
             "Authorization": f"Bearer {config.api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json",
-        }
+        })
         self.client = self._create_client()
 
     def _create_client(self) -> httpx.AsyncClient:
@@ -210,18 +218,21 @@ class KlingAPITextToVideoClient:
     async def _request(
         self,
         method: str,
-        endpoint: str,
+        url: str,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Make an HTTP request to the Kling AI API."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        """Make an HTTP request to the Kling AI API.
 
+        ``url`` is the absolute request URL, built once per endpoint in
+        ``__init__`` so it is not reformatted on every call.
+        """
         try:
             response = await self.client.request(
                 method=method,
                 url=url,
-                json=data,
+                # The client already sends Content-Type: application/json
+                content=None if data is None else orjson.dumps(data, default=str),
                 params=params,
             )
 
@@ -262,7 +273,7 @@ class KlingAPITextToVideoClient:
 
             # Handle successful responses
             if 200 <= response.status_code < 300:
-                return response.json()
+                return orjson.loads(response.content)
 
             # Handle other error cases
             error_data = response.json()
@@ -286,8 +297,8 @@ class KlingAPITextToVideoClient:
     async def create_task(self, request: TextToVideoRequest) -> dict[str, Any]:
         """Create a new text-to-video task."""
         try:
-            data = request.dict(exclude_none=True)
-            return await self._request("POST", "/v1/videos/text2video", data=data)
+            data = request.model_dump(exclude_none=True)
+            return await self._request("POST", self._tasks_url, data=data)
         except Exception as exc:
             logger.error("Failed to create task: %s", exc)
             raise
@@ -295,7 +306,7 @@ class KlingAPITextToVideoClient:
     async def get_task_status(self, task_id: str) -> dict[str, Any]:
         """Get the status of a task."""
         validate_task_id(task_id)
-        return await self._request("GET", f"/v1/videos/text2video/{task_id}")
+        return await self._request("GET", self._task_url_prefix + task_id)
 
     async def list_tasks(
         self,
@@ -309,7 +320,7 @@ class KlingAPITextToVideoClient:
             raise ValueError("page_size must be between 1 and 500")
             
         params = {"pageNum": page_num, "pageSize": page_size}
-        return await self._request("GET", "/v1/videos/text2video", params=params)
+        return await self._request("GET", self._tasks_url, params=params)
 
     async def __aenter__(self) -> KlingAPITextToVideoClient:
         """Async context manager entry."""
@@ -7,7 +7,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
 
 
 class TaskStatus(str, Enum):
@@ -40,6 +40,8 @@ class TaskInfo(BaseModel):
 
 class TaskResponse(BaseModel):
     """Response model for a text-to-video task."""
+    model_config = ConfigDict(frozen=True)
+
     task_id: str = Field(..., description="Unique identifier for the task")
     task_status: TaskStatus = Field(..., description="Current status of the task")
     task_status_msg: str | None = Field(
@@ -54,10 +56,12 @@ class TaskResponse(BaseModel):
         description="Task result, available when task is completed"
     )
 
-    @field_validator('created_at', 'updated_at', pre=True)
-    def convert_timestamps(cls, v: int) -> int:
+    @field_validator('created_at', 'updated_at', mode='before')
+    @classmethod
+    def convert_timestamps(cls, v: Any) -> Any:
         """Convert timestamps to milliseconds if they're in seconds."""
-        if v < 1_000_000_000:  # Likely in seconds
+        # Millisecond timestamps have exceeded 1e11 since 1973; smaller values are seconds
+        if isinstance(v, (int, float)) and v < 100_000_000_000:
             return v * 1000
         return v
 
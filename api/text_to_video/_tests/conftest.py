@@ -0,0 +1,42 @@
+"""Test configuration and fixtures for the Kling AI Text-to-Video API client."""
+from __future__ import annotations
+
+from typing import Callable
+
+import httpx
+import pytest
+
+from app.core.third_party_integrations.kling.api.text_to_video.text_to_video import TextToVideoAPI
+from app.core.third_party_integrations.kling.config import KlingConfig
+
+# Test data
+TEST_API_KEY = "test_api_key"
+
+
+@pytest.fixture
+async def text_to_video_api():
+    """Create a TextToVideoAPI instance and close it after the test."""
+    api = TextToVideoAPI(KlingConfig(api_key=TEST_API_KEY))
+    yield api
+    await api.close()
+
+
+@pytest.fixture
+def mock_transport(text_to_video_api) -> Callable[[Callable[[httpx.Request], httpx.Response]], list]:
+    """Route the API's HTTP client through a handler; returns the list of sent requests."""
+    def install(handler: Callable[[httpx.Request], httpx.Response]) -> list[httpx.Request]:
+        sent: list[httpx.Request] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return handler(request)
+
+        client = text_to_video_api.client
+        client.client = httpx.AsyncClient(
+            base_url=client.base_url,
+            headers=client.headers,
+            transport=httpx.MockTransport(record),
+        )
+        return sent
+
+    return install
@@ -0,0 +1,302 @@
+"""Tests for the Kling AI Text-to-Video API client."""
+from __future__ import annotations
+
+import httpx
+import orjson
+import pytest
+
+from pydantic import ValidationError
+
+from app.core.third_party_integrations.kling.api.text_to_video._exceptions import (
+    KlingAPIError,
+    TaskFailedError,
+)
+from app.core.third_party_integrations.kling.api.text_to_video._requests import (
+    CameraConfig,
+    CameraControl,
+)
+from app.core.third_party_integrations.kling.api.text_to_video._response import (
+    TaskResponse,
+    TaskStatus,
+)
+
+TASKS_PATH = "/v1/videos/text2video"
+VIDEO_URL = "https://cdn.example.com/video.mp4"
+VIDEO_BYTES = bytes(range(256)) * 40
+
+
+def _task(task_id: str, status: str, **extra) -> dict:
+    """Build a task object as returned by the API."""
+    return {
+        "task_id": task_id,
+        "task_status": status,
+        "task_info": {},
+        "created_at": 1_700_000_000_000,
+        "updated_at": 1_700_000_000_000,
+        **extra,
+    }
+
+
+def _json(payload: dict, status_code: int = 200, headers: dict | None = None) -> httpx.Response:
+    """Build a real httpx.Response carrying a JSON payload."""
+    return httpx.Response(status_code, content=orjson.dumps(payload), headers=headers)
+
+
+def _status_sequence(statuses: dict[str, list[dict | httpx.Response]]):
+    """Return a handler answering status checks with each task's next response in turn."""
+    remaining = {task_id: list(responses) for task_id, responses in statuses.items()}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        task_id = request.url.path.rsplit("/", 1)[-1]
+        responses = remaining[task_id]
+        response = responses.pop(0) if len(responses) > 1 else responses[0]
+        return response if isinstance(response, httpx.Response) else _json(response)
+
+    return handler
+
+
+class TestModels:
+    """Test request and response model validation."""
+    
+    def test_task_response_timestamps_in_seconds(self):
+        """Test second-resolution timestamps are normalised to milliseconds."""
+        task = TaskResponse.model_validate(_task("task_1", "succeed", created_at=1_700_000_000))
+        
+        assert task.created_at == 1_700_000_000_000
+        assert task.updated_at == 1_700_000_000_000
+    
+    def test_camera_config_single_parameter(self):
+        """Test only one camera parameter may be non-zero."""
+        assert CameraConfig(zoom=5, pan=0).zoom == 5
+        with pytest.raises(ValidationError):
+            CameraConfig(zoom=5, pan=2)
+    
+    def test_simple_camera_control_requires_config(self):
+        """Test the simple camera type needs a config."""
+        with pytest.raises(ValidationError):
+            CameraControl(type="simple")
+
+
+class TestCreate:
+    """Test the create method."""
+    
+    async def test_submits_task(self, text_to_video_api, mock_transport):
+        """Test create() posts a validated request body and parses the task."""
+        sent = mock_transport(lambda request: _json(_task("task_1", "submitted")))
+        
+        task = await text_to_video_api.create(
+            prompt="A cat surfing a wave",
+            mode="professional",
+            camera_control={"type": "simple", "config": {"zoom": 5}},
+            callback_url="https://example.com/callback",
+        )
+        
+        assert task.task_id == "task_1"
+        assert task.task_status is TaskStatus.SUBMITTED
+        assert len(sent) == 1
+        assert sent[0].method == "POST"
+        assert sent[0].url.path == TASKS_PATH
+        assert orjson.loads(sent[0].content) == {
+            "model_name": "kling-v1",
+            "prompt": "A cat surfing a wave",
+            "cfg_scale": 0.5,
+            "mode": "pro",
+            "camera_control": {"type": "simple", "config": {"zoom": 5.0}},
+            "aspect_ratio": "16:9",
+            "duration": 5,
+            "callback_url": "https://example.com/callback",
+        }
+    
+    async def test_invalid_request_is_not_sent(self, text_to_video_api, mock_transport):
+        """Test a request failing validation never reaches the API."""
+        sent = mock_transport(lambda request: _json(_task("task_1", "submitted")))
+        
+        with pytest.raises(KlingAPIError, match="duration"):
+            await text_to_video_api.create(prompt="A cat", duration=7)
+        assert sent == []
+    
+    async def test_dedup_window_shares_identical_creates(self, text_to_video_api, mock_transport):
+        """Test identical create() calls inside the dedup window submit one task."""
+        sent = mock_transport(lambda request: _json(_task(f"task_{len(sent)}", "submitted")))
+        text_to_video_api.dedup_window = 60.0
+        
+        first = await text_to_video_api.create(prompt="A cat", camera_control={"type": "simple", "config": {"zoom": 5}})
+        second = await text_to_video_api.create(prompt="A cat", camera_control={"type": "simple", "config": {"zoom": 5}})
+        other = await text_to_video_api.create(prompt="A dog")
+        
+        assert second.task_id == first.task_id
+        assert other.task_id != first.task_id
+        assert len(sent) == 2
+
+
+class TestWaitForCompletion:
+    """Test the wait_for_completion method."""
+    
+    async def test_returns_final_status(self, text_to_video_api, mock_transport):
+        """Test polling continues until the task succeeds."""
+        sent = mock_transport(_status_sequence({
+            "task_1": [
+                _task("task_1", "submitted"),
+                _task("task_1", "processing"),
+                _task("task_1", "succeed", task_result={
+                    "videos": [{"id": "v1", "url": VIDEO_URL, "duration": 5.0}],
+                }),
+            ],
+        }))
+        
+        status = await text_to_video_api.wait_for_completion("task_1", poll_interval=0.01)
+        
+        assert status.task_status is TaskStatus.SUCCEEDED
+        assert status.video_url == VIDEO_URL
+        assert len(sent) == 3
+        assert sent[0].url.path == f"{TASKS_PATH}/task_1"
+    
+    async def test_failed_task_raises(self, text_to_video_api, mock_transport):
+        """Test a failed task raises TaskFailedError with its message."""
+        mock_transport(_status_sequence({
+            "task_1": [_task("task_1", "failed", task_status_msg="content policy")],
+        }))
+        
+        with pytest.raises(TaskFailedError, match="content policy"):
+            await text_to_video_api.wait_for_completion("task_1", poll_interval=0.01)
+    
+    async def test_rate_limited_poll_is_retried(self, text_to_video_api, mock_transport):
+        """Test a 429 with Retry-After pauses polling instead of failing."""
+        sent = mock_transport(_status_sequence({
+            "task_1": [
+                _json({"message": "slow down"}, status_code=429, headers={"Retry-After": "0"}),
+                _task("task_1", "succeed"),
+            ],
+        }))
+        
+        status = await text_to_video_api.wait_for_completion("task_1", poll_interval=0.01)
+        
+        assert status.task_status is TaskStatus.SUCCEEDED
+        assert len(sent) == 2
+    
+    async def test_timeout(self, text_to_video_api, mock_transport):
+        """Test a task that never finishes raises TimeoutError."""
+        mock_transport(_status_sequence({"task_1": [_task("task_1", "processing")]}))
+        
+        with pytest.raises(TimeoutError, match="task_1"):
+            await text_to_video_api.wait_for_completion("task_1", poll_interval=0.01, timeout=0.1)
+
+
+class TestWaitForMany:
+    """Test the wait_for_many method."""
+    
+    async def test_returns_every_final_status(self, text_to_video_api, mock_transport):
+        """Test tasks are polled together and failures are returned, not raised."""
+        sent = mock_transport(_status_sequence({
+            "task_1": [_task("task_1", "processing"), _task("task_1", "succeed")],
+            "task_2": [_task("task_2", "failed", task_status_msg="bad prompt")],
+        }))
+        
+        results = await text_to_video_api.wait_for_many(
+            ["task_1", "task_2", "task_1"], poll_interval=0.01
+        )
+        
+        assert results["task_1"].task_status is TaskStatus.SUCCEEDED
+        assert results["task_2"].task_status is TaskStatus.FAILED
+        # Duplicate IDs are polled once; task_2 drops out after the first round
+        assert [request.url.path.rsplit("/", 1)[-1] for request in sent] == [
+            "task_1", "task_2", "task_1",
+        ]
+    
+    async def test_timeout_names_pending_tasks(self, text_to_video_api, mock_transport):
+        """Test the timeout error lists only the tasks still running."""
+        mock_transport(_status_sequence({
+            "task_1": [_task("task_1", "succeed")],
+            "task_2": [_task("task_2", "processing")],
+        }))
+        
+        with pytest.raises(TimeoutError) as exc_info:
+            await text_to_video_api.wait_for_many(
+                ["task_1", "task_2"], poll_interval=0.01, timeout=0.1
+            )
+        assert "task_2" in str(exc_info.value)
+        assert "task_1" not in str(exc_info.value)
+
+
+def _video_handler(accept_ranges: bool):
+    """Return a handler serving VIDEO_BYTES, honouring Range requests if enabled."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        headers = {"Content-Length": str(len(VIDEO_BYTES))}
+        if accept_ranges:
+            headers["Accept-Ranges"] = "bytes"
+        if request.method == "HEAD":
+            return httpx.Response(200, headers=headers)
+        byte_range = request.headers.get("Range")
+        if accept_ranges and byte_range:
+            start, end = map(int, byte_range.removeprefix("bytes=").split("-"))
+            return httpx.Response(206, content=VIDEO_BYTES[start:end + 1])
+        return httpx.Response(200, content=VIDEO_BYTES)
+
+    return handler
+
+
+class TestDownloadVideo:
+    """Test the download_video method."""
+    
+    async def test_streams_to_memory(self, text_to_video_api, mock_transport):
+        """Test a single streamed download returns the full content."""
+        mock_transport(_video_handler(accept_ranges=False))
+        
+        content = await text_to_video_api.download_video(VIDEO_URL, chunk_size=1000)
+        
+        assert type(content) is bytes
+        assert content == VIDEO_BYTES
+    
+    async def test_streams_to_file(self, text_to_video_api, mock_transport, tmp_path):
+        """Test a streamed download written to disk."""
+        mock_transport(_video_handler(accept_ranges=False))
+        
+        path = await text_to_video_api.download_video(VIDEO_URL, tmp_path / "video.mp4")
+        
+        assert path == tmp_path / "video.mp4"
+        assert path.read_bytes() == VIDEO_BYTES
+    
+    async def test_ranged_download(self, text_to_video_api, mock_transport, tmp_path):
+        """Test parts > 1 fetches concurrent byte ranges and reassembles them."""
+        sent = mock_transport(_video_handler(accept_ranges=True))
+        
+        content = await text_to_video_api.download_video(VIDEO_URL, parts=4, chunk_size=1000)
+        path = await text_to_video_api.download_video(VIDEO_URL, tmp_path / "video.mp4", parts=4)
+        
+        assert type(content) is bytes
+        assert content == VIDEO_BYTES
+        assert path.read_bytes() == VIDEO_BYTES
+        ranges = sorted(request.headers["Range"] for request in sent if "Range" in request.headers)
+        assert ranges == sorted(2 * ["bytes=0-2559", "bytes=2560-5119", "bytes=5120-7679", "bytes=7680-10239"])
+    
+    async def test_ranged_download_falls_back_to_stream(self, text_to_video_api, mock_transport):
+        """Test a server without range support gets a single streamed request."""
+        sent = mock_transport(_video_handler(accept_ranges=False))
+        
+        content = await text_to_video_api.download_video(VIDEO_URL, parts=4)
+        
+        assert content == VIDEO_BYTES
+        assert [request.method for request in sent] == ["HEAD", "GET"]
+        assert "Range" not in sent[1].headers
+
+
+class TestIterTasks:
+    """Test the iter_tasks method."""
+    
+    async def test_yields_every_page(self, text_to_video_api, mock_transport):
+        """Test iteration stops after the first short page."""
+        pages = {
+            1: [_task("task_1", "succeed"), _task("task_2", "processing")],
+            2: [_task("task_3", "failed")],
+        }
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            return _json({"data": pages[int(request.url.params["pageNum"])]})
+        
+        sent = mock_transport(handler)
+        
+        task_ids = [task.task_id async for task in text_to_video_api.iter_tasks(page_size=2)]
+        
+        assert task_ids == ["task_1", "task_2", "task_3"]
+        assert [request.url.params["pageNum"] for request in sent] == ["1", "2"]
+        assert all(request.url.params["pageSize"] == "2" for request in sent)
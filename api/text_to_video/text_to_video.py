@@ -8,81 +8,60 @@ customization options.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
-from typing import Optional
+import random
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
 
-from pydantic import HttpUrl
+import orjson
+from pydantic import BaseModel, HttpUrl
 
-from ...client import KlingClient
 from ...config import KlingConfig
 from ...models.text_to_video import TextToVideoTask
-from ._exceptions import TaskFailedError, handle_api_error
-from ._requests import KlingAPITextToVideoClient
+from ._exceptions import RateLimitError, TaskFailedError, handle_api_error
+from ._requests import KlingAPITextToVideoClient, TextToVideoRequest
 from ._response import TaskResponse, TaskStatus
 
+# Re-export commonly used types and models
+__all__ = [
+    'TextToVideoAPI',
+    'TaskResponse',
+    'TaskStatus',
+    'TextToVideoTask',
+    'generate_text_to_video',
+    'close_shared_clients',
+]
 
-class TextToVideoAPI:
-    """
-    API route client for Kling AI Text-to-Video endpoints.
+logger = logging.getLogger(__name__)
 
-    This class should be instantiated by the main KlingClient singleton and accessed via `client.text_to_video`.
-    """
-    def __init__(self, client: KlingClient) -> None:
-        """
-        Args:
-            client: The singleton KlingClient instance
-        """
-        self._client = client
-        self._http = client._client  # httpx.AsyncClient
-        self.base_url = client.base_url
+# Polling backoff: first delay in seconds and the +/- jitter fraction applied to each delay
+_INITIAL_POLL_DELAY = 0.5
+_POLL_JITTER = 0.2
 
-    async def create_video(self, prompt: str, duration: int = 5, **kwargs) -> TaskResponse:
-        """Create a new video generation task.
+# Mode names accepted by create() alongside the API's own "std"/"pro"
+_MODE_ALIASES = {"standard": "std", "professional": "pro"}
 
-        Args:
-            prompt: Text prompt for video generation
-            duration: Duration of the video in seconds (default: 5)
-            **kwargs: Additional API parameters
+# Highest pageNum accepted by the task list endpoint
+_MAX_LIST_PAGE = 1000
 
-        Returns:
-            TaskResponse: The created video task response
-        """
-        data = {"prompt": prompt, "duration": duration, **kwargs}
-        try:
-            resp = await self._http.post(f"{self.base_url}/v1/videos/text2video", json=data)
-            resp.raise_for_status()
-            return TaskResponse.model_validate(resp.json())
-        except Exception as e:
-            raise handle_api_error(e)
+# Statuses after which a task no longer changes
+_TERMINAL_STATES: frozenset[TaskStatus] = frozenset({TaskStatus.SUCCEEDED, TaskStatus.FAILED})
 
-    async def get_status(self, task_id: str) -> TaskResponse:
-        """Get the status of a video generation task.
 
-        Args:
-            task_id: The ID of the video generation task
+class _TaskListEnvelope(BaseModel):
+    """The ``data`` field of a task list response; other envelope fields are ignored."""
+    data: list[TaskResponse] = []
 
-        Returns:
-            TaskResponse: The task status response
-        """
-        try:
-            resp = await self._http.get(f"{self.base_url}/v1/videos/text2video/{task_id}")
-            resp.raise_for_status()
-            return TaskResponse.model_validate(resp.json())
-        except Exception as e:
-            raise handle_api_error(e)
 
-# Export for main client registration
-__all__ = ["TextToVideoAPI"]
+# Clients reused by generate_text_to_video, keyed by API key
+_shared_clients: dict[str, tuple[asyncio.AbstractEventLoop, TextToVideoAPI]] = {}
 
-logger = logging.getLogger(__name__)
 
-# Re-export commonly used types and models
-__all__ = [
-    'TextToVideoAPI',
-    'TaskResponse',
-    'TaskStatus',
-    'TextToVideoTask',
-]
+def _poll_delay(attempt: int, poll_interval: float) -> float:
+    """Return the jittered backoff delay before the next status check."""
+    delay = min(poll_interval, _INITIAL_POLL_DELAY * 2 ** attempt)
+    return delay * random.uniform(1 - _POLL_JITTER, 1 + _POLL_JITTER)
 
 
 class TextToVideoAPI:
@@ -93,14 +72,19 @@ class TextToVideoAPI:
     generation tasks with the Kling AI API.
     """
 
-    def __init__(self, config: KlingConfig) -> None:
+    def __init__(self, config: KlingConfig, dedup_window: float | None = None) -> None:
         """Initialize the Text-to-Video API client.
         
         Args:
             config: KlingConfig instance with API configuration
+            dedup_window: If set, identical create() calls made within this many
+                seconds of each other share one task instead of submitting a new one
         """
         self.config = config
+        self.dedup_window = dedup_window
         self._client: Optional[KlingAPITextToVideoClient] = None
+        # Recent create() submissions keyed by a hash of their parameters
+        self._recent_creates: dict[bytes, tuple[float, asyncio.Future[TaskResponse]]] = {}
 
     async def __aenter__(self) -> "TextToVideoAPI":
         """Async context manager entry."""
@@ -143,7 +127,7 @@ class TextToVideoAPI:
             negative_prompt: Text describing what to avoid in the video
             model_name: Name of the model to use (default: "kling-v1")
             cfg_scale: Controls how closely to follow the prompt (0.0 to 1.0)
-            mode: Video generation mode ("standard" or "professional")
+            mode: Video generation mode ("standard"/"std" or "professional"/"pro")
             camera_control: Camera movement configuration
             aspect_ratio: Aspect ratio of the generated video (e.g., "16:9")
             duration: Duration of the video in seconds (5 or 10)
@@ -157,20 +141,48 @@ class TextToVideoAPI:
             TaskFailedError: If the task fails
             Exception: For other API errors
         """
+        params = {
+            "prompt": prompt,
+            "negative_prompt": negative_prompt,
+            "model_name": model_name,
+            "cfg_scale": cfg_scale,
+            "mode": _MODE_ALIASES.get(mode, mode),
+            "camera_control": camera_control,
+            "aspect_ratio": aspect_ratio,
+            "duration": duration,
+            "callback_url": callback_url,
+            "external_task_id": external_task_id,
+        }
+        if not self.dedup_window:
+            return await self._submit(params)
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        for stale_key, (submitted_at, future) in list(self._recent_creates.items()):
+            if future.done() and now - submitted_at > self.dedup_window:
+                del self._recent_creates[stale_key]
+
+        key = hashlib.blake2b(
+            orjson.dumps(params, option=orjson.OPT_SORT_KEYS, default=str)
+        ).digest()
+        entry = self._recent_creates.get(key)
+        if entry is None:
+            def forget_unsuccessful(f: asyncio.Future[TaskResponse]) -> None:
+                # Only successful submissions are shared with later callers
+                if f.cancelled() or f.exception() is not None:
+                    self._recent_creates.pop(key, None)
+
+            future = asyncio.ensure_future(self._submit(params))
+            future.add_done_callback(forget_unsuccessful)
+            entry = self._recent_creates[key] = (now, future)
+        return await asyncio.shield(entry[1])
+
+    async def _submit(self, params: dict[str, Any]) -> TaskResponse:
+        """Submit a text-to-video task and parse the API response."""
         try:
-            response = await self.client.create_task(
-                prompt=prompt,
-                negative_prompt=negative_prompt,
-                model_name=model_name,
-                cfg_scale=cfg_scale,
-                mode=mode,
-                camera_control=camera_control,
-                aspect_ratio=aspect_ratio,
-                duration=duration,
-                callback_url=callback_url,
-                external_task_id=external_task_id,
-            )
-            return TaskResponse(**response)
+            request = TextToVideoRequest(**params)
+            response = await self.client.create_task(request)
+            return TaskResponse.model_validate(response)
         except Exception as exc:
             logger.error("Failed to create text-to-video task: %s", exc)
             raise handle_api_error(exc) from exc
@@ -190,7 +202,7 @@ class TextToVideoAPI:
         """
         try:
             response = await self.client.get_task_status(task_id)
-            return TaskResponse(**response)
+            return TaskResponse.model_validate(response)
         except Exception as exc:
             logger.error("Failed to get task status for %s: %s", task_id, exc)
             raise handle_api_error(exc) from exc
@@ -202,10 +214,15 @@ class TextToVideoAPI:
         timeout: float | None = 300.0,
     ) -> TaskResponse:
         """Wait for a task to complete by polling its status.
+
+        Polling starts at a short delay that doubles on every check, capped at
+        ``poll_interval``, with random jitter so concurrent waiters do not poll
+        in lockstep. A ``Retry-After`` hint from a rate-limited status check is
+        honored before polling resumes.
         
         Args:
             task_id: ID of the task to monitor
-            poll_interval: Time between status checks in seconds
+            poll_interval: Maximum time between status checks in seconds
             timeout: Maximum time to wait in seconds (None for no timeout)
             
         Returns:
@@ -216,46 +233,242 @@ class TextToVideoAPI:
             TaskFailedError: If the task fails
             Exception: For other API errors
         """
-        start_time = asyncio.get_event_loop().time()
+        try:
+            return await asyncio.wait_for(self._poll_until_done(task_id, poll_interval), timeout)
+        except asyncio.TimeoutError as exc:
+            raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds") from exc
+
+    async def _poll_until_done(self, task_id: str, poll_interval: float) -> TaskResponse:
+        """Poll a task until it reaches a terminal state; see :meth:`wait_for_completion`."""
+        attempt = 0
         
         while True:
-            status = await self.get_status(task_id)
+            try:
+                status = await self.get_status(task_id)
+            except RateLimitError as exc:
+                if exc.retry_after is None:
+                    raise
+                status = None
+                delay = float(exc.retry_after)
+            else:
+                delay = _poll_delay(attempt, poll_interval)
+                attempt += 1
             
-            if status.task_status in (TaskStatus.SUCCEEDED, TaskStatus.FAILED):
-                if status.task_status == TaskStatus.FAILED:
+            if status is not None and status.task_status in _TERMINAL_STATES:
+                if status.task_status is TaskStatus.FAILED:
                     error_msg = status.task_status_msg or "Task failed without details"
                     raise TaskFailedError(
                         f"Task {task_id} failed: {error_msg}",
                         task_id=task_id,
-                        status=status,
+                        task_status=status.task_status.value,
                     )
                 return status
                 
-            if timeout is not None and (asyncio.get_event_loop().time() - start_time) > timeout:
-                raise TimeoutError(f"Task {task_id} did not complete within {timeout} seconds")
-                
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(delay)
+
+    async def wait_for_many(
+        self,
+        task_ids: list[str],
+        poll_interval: float = 5.0,
+        timeout: float | None = 300.0,
+    ) -> dict[str, TaskResponse]:
+        """Wait for several tasks to complete, polling them concurrently.
+
+        Each poll round checks every still-pending task in parallel and then
+        sleeps once, using the same backoff as :meth:`wait_for_completion`.
+        Unlike :meth:`wait_for_completion`, failed tasks do not raise; their
+        final status is returned so callers can inspect each outcome.
+
+        Args:
+            task_ids: IDs of the tasks to monitor
+            poll_interval: Maximum time between poll rounds in seconds
+            timeout: Maximum time to wait in seconds (None for no timeout)
+
+        Returns:
+            Mapping of task ID to its final TaskResponse
+
+        Raises:
+            TimeoutError: If any task doesn't complete before timeout
+            Exception: For API errors other than rate limiting
+        """
+        pending = list(dict.fromkeys(task_ids))
+        results: dict[str, TaskResponse] = {}
+        try:
+            await asyncio.wait_for(self._poll_many(pending, results, poll_interval), timeout)
+        except asyncio.TimeoutError as exc:
+            raise TimeoutError(
+                f"Tasks {', '.join(pending)} did not complete within {timeout} seconds"
+            ) from exc
+        return results
+
+    async def _poll_many(
+        self,
+        pending: list[str],
+        results: dict[str, TaskResponse],
+        poll_interval: float,
+    ) -> None:
+        """Poll tasks until all are terminal; see :meth:`wait_for_many`.
+
+        ``pending`` is updated in place so the caller can report which tasks
+        were still running if the wait times out.
+        """
+        attempt = 0
+
+        while pending:
+            statuses = await asyncio.gather(
+                *(self.get_status(task_id) for task_id in pending),
+                return_exceptions=True,
+            )
+            delay = _poll_delay(attempt, poll_interval)
+            attempt += 1
 
-    async def download_video(self, url: str) -> bytes:
+            still_pending = []
+            for task_id, status in zip(pending, statuses):
+                if isinstance(status, RateLimitError) and status.retry_after is not None:
+                    delay = max(delay, float(status.retry_after))
+                    still_pending.append(task_id)
+                elif isinstance(status, BaseException):
+                    raise status
+                elif status.task_status in _TERMINAL_STATES:
+                    results[task_id] = status
+                else:
+                    still_pending.append(task_id)
+            pending[:] = still_pending
+
+            if pending:
+                await asyncio.sleep(delay)
+
+    async def download_video(
+        self,
+        url: str,
+        path: str | Path | None = None,
+        chunk_size: int = 65536,
+        parts: int = 1,
+    ) -> bytes | Path:
         """Download a generated video from a URL.
+
+        The response is streamed in fixed-size chunks. When ``path`` is given
+        each chunk is written straight to disk, so memory use stays bounded by
+        ``chunk_size`` regardless of the video size.
+
+        With ``parts`` greater than 1 the video is fetched as that many
+        concurrent HTTP Range requests into a preallocated buffer. If the
+        server does not support ranges it falls back to a single stream.
         
         Args:
             url: URL of the video to download
+            path: Local file to write the video to (None to return the bytes)
+            chunk_size: Size of chunks to download at once
+            parts: Number of concurrent range requests to split the download into
             
         Returns:
-            Video content as bytes
+            The path written to if ``path`` was given, else the video content as bytes
             
         Raises:
             Exception: If the download fails
         """
         try:
+            if parts > 1:
+                content = await self._download_ranges(url, parts, chunk_size)
+                if content is not None:
+                    if path is None:
+                        return bytes(content)
+                    path = Path(path)
+                    await asyncio.to_thread(path.write_bytes, content)
+                    return path
+
             async with self.client.client.stream("GET", url) as response:
                 response.raise_for_status()
-                return await response.aread()
+                if path is not None:
+                    path = Path(path)
+                    # File I/O runs in a worker thread so the event loop keeps
+                    # serving other requests while the disk catches up
+                    f = await asyncio.to_thread(path.open, "wb")
+                    try:
+                        async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                            await asyncio.to_thread(f.write, chunk)
+                    finally:
+                        await asyncio.to_thread(f.close)
+                    return path
+
+                content = bytearray()
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    content.extend(chunk)
+                return bytes(content)
         except Exception as exc:
             logger.error("Failed to download video from %s: %s", url, exc)
             raise Exception(f"Failed to download video: {exc}") from exc
 
+    async def download_video_view(self, url: str, chunk_size: int = 65536) -> memoryview:
+        """Download a generated video into a single buffer and return a view of it.
+
+        When the server sends ``Content-Length`` the buffer is allocated once at
+        that size and chunks are copied straight into it. The returned
+        ``memoryview`` can be written to a file, hashed or sliced without
+        copying the video again.
+        
+        Args:
+            url: URL of the video to download
+            chunk_size: Size of chunks to download at once
+            
+        Returns:
+            A memoryview over the downloaded video content
+            
+        Raises:
+            Exception: If the download fails
+        """
+        try:
+            async with self.client.client.stream("GET", url) as response:
+                response.raise_for_status()
+                total = int(response.headers.get("Content-Length", 0))
+                buffer = bytearray(total)
+                offset = 0
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    buffer[offset:offset + len(chunk)] = chunk
+                    offset += len(chunk)
+                # Drop any unused space if the body was shorter than advertised
+                del buffer[offset:]
+                return memoryview(buffer)
+        except Exception as exc:
+            logger.error("Failed to download video from %s: %s", url, exc)
+            raise Exception(f"Failed to download video: {exc}") from exc
+
+    async def _download_ranges(
+        self,
+        url: str,
+        parts: int,
+        chunk_size: int,
+    ) -> bytearray | None:
+        """Fetch a URL as concurrent byte ranges into a single buffer.
+
+        Returns:
+            The downloaded content, or None if the server does not support ranges
+        """
+        http = self.client.client
+        head = await http.head(url)
+        head.raise_for_status()
+        total = int(head.headers.get("Content-Length", 0))
+        if not total or head.headers.get("Accept-Ranges", "").lower() != "bytes":
+            return None
+
+        buffer = bytearray(total)
+        step = -(-total // parts)
+
+        async def fetch(start: int) -> bool:
+            end = min(start + step, total) - 1
+            async with http.stream("GET", url, headers={"Range": f"bytes={start}-{end}"}) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    return False
+                offset = start
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    buffer[offset:offset + len(chunk)] = chunk
+                    offset += len(chunk)
+            return True
+
+        fetched = await asyncio.gather(*(fetch(start) for start in range(0, total, step)))
+        return buffer if all(fetched) else None
+
     async def list_tasks(
         self,
         page: int = 1,
@@ -274,12 +487,45 @@ class TextToVideoAPI:
             Exception: If the request fails
         """
         try:
-            response = await self.client.list_tasks(page=page, page_size=page_size)
-            return [TaskResponse(**task) for task in response.get("data", [])]
+            response = await self.client.list_tasks(page_num=page, page_size=page_size)
+            return _TaskListEnvelope.model_validate(response).data
         except Exception as exc:
             logger.error("Failed to list tasks: %s", exc)
             raise handle_api_error(exc) from exc
 
+    async def iter_tasks(self, page_size: int = 100) -> AsyncIterator[TaskResponse]:
+        """Iterate over all text-to-video tasks, page by page.
+
+        The next page is requested as soon as the current one arrives, so its
+        round trip overlaps with the caller's processing of the current page.
+        
+        Args:
+            page_size: Number of tasks per page (1-500)
+            
+        Yields:
+            TaskResponse objects in listing order
+            
+        Raises:
+            Exception: If a page request fails
+        """
+        page = 1
+        next_page = asyncio.ensure_future(self.list_tasks(page=page, page_size=page_size))
+        try:
+            while next_page is not None:
+                tasks = await next_page
+                next_page = None
+                # A short page is the last one; the API serves at most 1000 pages
+                if len(tasks) == page_size and page < _MAX_LIST_PAGE:
+                    page += 1
+                    next_page = asyncio.ensure_future(
+                        self.list_tasks(page=page, page_size=page_size)
+                    )
+                for task in tasks:
+                    yield task
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
     async def generate(
         self,
         prompt: str,
@@ -344,7 +590,7 @@ class TextToVideoAPI:
         
         # Download the video if successful
         video_bytes = None
-        if status.task_status == TaskStatus.SUCCEEDED and status.video_url:
+        if status.task_status is TaskStatus.SUCCEEDED and status.video_url:
             video_bytes = await self.download_video(status.video_url)
             
         return status, video_bytes
@@ -366,8 +612,9 @@ async def generate_text_to_video(
 ) -> tuple[TaskResponse, bytes | None]:
     """Convenience function to generate a video with minimal setup.
     
-    This creates a new TextToVideoAPI client, generates a video, and returns
-    the result, automatically cleaning up resources.
+    Clients are cached per API key and event loop, so repeated calls reuse
+    the same pooled HTTP connections. Call :func:`close_shared_clients` on
+    shutdown to release them.
     
     Args:
         prompt: Text prompt describing the desired video
@@ -391,18 +638,41 @@ async def generate_text_to_video(
         TaskFailedError: If the task fails
         Exception: For other API errors
     """
-    config = KlingConfig(api_key=api_key)
-    async with TextToVideoAPI(config) as client:
-        return await client.generate(
-            prompt=prompt,
-            negative_prompt=negative_prompt,
-            model_name=model_name,
-            cfg_scale=cfg_scale,
-            mode=mode,
-            camera_control=camera_control,
-            aspect_ratio=aspect_ratio,
-            duration=duration,
-            wait=wait,
-            poll_interval=poll_interval,
-            timeout=timeout,
-        )
+    client = _get_shared_client(api_key)
+    return await client.generate(
+        prompt=prompt,
+        negative_prompt=negative_prompt,
+        model_name=model_name,
+        cfg_scale=cfg_scale,
+        mode=mode,
+        camera_control=camera_control,
+        aspect_ratio=aspect_ratio,
+        duration=duration,
+        wait=wait,
+        poll_interval=poll_interval,
+        timeout=timeout,
+    )
+
+
+def _get_shared_client(api_key: str) -> TextToVideoAPI:
+    """Return the cached client for an API key, creating it if needed.
+
+    httpx connections are bound to the event loop that opened them, so a
+    cached client is only reused on the loop it was created on.
+    """
+    loop = asyncio.get_running_loop()
+    cached = _shared_clients.get(api_key)
+    if cached is not None and cached[0] is loop:
+        return cached[1]
+    client = TextToVideoAPI(KlingConfig(api_key=api_key))
+    _shared_clients[api_key] = (loop, client)
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close the clients cached by :func:`generate_text_to_video` on this loop."""
+    loop = asyncio.get_running_loop()
+    for api_key, (client_loop, client) in list(_shared_clients.items()):
+        if client_loop is loop:
+            del _shared_clients[api_key]
+            await client.close()
@@ -24,19 +24,60 @@ Example:
 """
 from __future__ import annotations
 
-from .video_effects import VideoEffectsAPI
-from ._requests import CreateVideoEffectRequest, ListTasksRequest, TaskStatus, EffectType, VideoQuality
-from ._responses import CreateTaskResponse, GetTaskResponse, ListTasksResponse, CancelTaskResponse
-from ._exceptions import (
-    VideoEffectsError,
-    VideoEffectsValidationError,
-    VideoEffectsRateLimitError,
-    VideoEffectsNotFoundError,
-    VideoEffectsUnauthorizedError,
-    VideoEffectsServerError,
-    VideoEffectsTimeoutError,
-    VideoEffectsConnectionError,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .video_effects import VideoEffectsAPI
+    from ._requests import CreateVideoEffectRequest, ListTasksRequest, TaskStatus, EffectType, VideoQuality
+    from ._responses import CreateTaskResponse, GetTaskResponse, ListTasksResponse, CancelTaskResponse
+    from ._exceptions import (
+        VideoEffectsError,
+        VideoEffectsValidationError,
+        VideoEffectsRateLimitError,
+        VideoEffectsNotFoundError,
+        VideoEffectsUnauthorizedError,
+        VideoEffectsServerError,
+        VideoEffectsTimeoutError,
+        VideoEffectsConnectionError,
+    )
+
+# Public names are imported from their submodule on first access (PEP 562),
+# so importing this package does not load the client, models and httpx up front.
+_LAZY_IMPORTS = {
+    "VideoEffectsAPI": ".video_effects",
+    "CreateVideoEffectRequest": "._requests",
+    "ListTasksRequest": "._requests",
+    "TaskStatus": "._requests",
+    "EffectType": "._requests",
+    "VideoQuality": "._requests",
+    "CreateTaskResponse": "._responses",
+    "GetTaskResponse": "._responses",
+    "ListTasksResponse": "._responses",
+    "CancelTaskResponse": "._responses",
+    "VideoEffectsError": "._exceptions",
+    "VideoEffectsValidationError": "._exceptions",
+    "VideoEffectsRateLimitError": "._exceptions",
+    "VideoEffectsNotFoundError": "._exceptions",
+    "VideoEffectsUnauthorizedError": "._exceptions",
+    "VideoEffectsServerError": "._exceptions",
+    "VideoEffectsTimeoutError": "._exceptions",
+    "VideoEffectsConnectionError": "._exceptions",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     # Main client
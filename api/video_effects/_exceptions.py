@@ -23,7 +23,7 @@ class VideoEffectsValidationError(VideoEffectsError):
 
 class VideoEffectsRateLimitError(VideoEffectsError):
     """Raised when rate limit is exceeded."""
-    def __init__(self, retry_after: int | None = None, **kwargs: Any):
+    def __init__(self, retry_after: float | None = None, **kwargs: Any):
         details = kwargs.pop("details", {})
         if retry_after is not None:
             details["retry_after"] = retry_after
@@ -55,6 +55,14 @@ class VideoEffectsConnectionError(VideoEffectsError):
     pass
 
 
+# Status codes that map directly to an exception taking (message, details)
+_STATUS_MAP: dict[int, type[VideoEffectsError]] = {
+    400: VideoEffectsValidationError,
+    401: VideoEffectsUnauthorizedError,
+    404: VideoEffectsNotFoundError,
+}
+
+
 def map_http_error(status_code: int, error_data: dict[str, Any] | None = None) -> VideoEffectsError:
     """Map HTTP status code to an appropriate exception.
     
@@ -68,16 +76,12 @@ def map_http_error(status_code: int, error_data: dict[str, Any] | None = None) -
     error_data = error_data or {}
     message = error_data.get("message", "An error occurred")
     
-    if status_code == 400:
-        return VideoEffectsValidationError(message, details=error_data)
-    elif status_code == 401:
-        return VideoEffectsUnauthorizedError(message, details=error_data)
-    elif status_code == 404:
-        return VideoEffectsNotFoundError(message, details=error_data)
-    elif status_code == 429:
+    error_cls = _STATUS_MAP.get(status_code)
+    if error_cls is not None:
+        return error_cls(message, details=error_data)
+    if status_code == 429:
         retry_after = error_data.get("retry_after")
         return VideoEffectsRateLimitError(retry_after=retry_after, details=error_data)
-    elif 500 <= status_code < 600:
+    if 500 <= status_code < 600:
         return VideoEffectsServerError(message, details=error_data)
-    else:
-        return VideoEffectsError(message, details=error_data)
+    return VideoEffectsError(message, details=error_data)
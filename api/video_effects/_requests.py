@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Literal
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, model_validator
 
 
 class EffectType(str, Enum):
@@ -15,6 +15,9 @@ class EffectType(str, Enum):
     STABILIZE = "stabilize"
 
 
+_EFFECT_TYPES = frozenset(effect.value for effect in EffectType)
+
+
 class VideoQuality(str, Enum):
     """Available video quality presets."""
     LOW = "low"
@@ -52,6 +55,23 @@ class CreateVideoEffectRequest(BaseModel):
         description="Optional metadata to associate with the task"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _validate(cls, data: Any) -> Any:
+        """Reject an unknown effect type with a set lookup, before field parsing.
+
+        The intensity bounds and URL formats are declared on the fields and
+        checked by pydantic-core.
+        """
+        if not isinstance(data, dict):
+            return data
+        effect_type = data.get("effect_type")
+        # Non-string values (possibly unhashable) are left for the enum field
+        # to report as a ValidationError
+        if isinstance(effect_type, str) and effect_type not in _EFFECT_TYPES:
+            raise ValueError(f"effect_type must be one of {sorted(_EFFECT_TYPES)}")
+        return data
+
 
 class TaskStatus(str, Enum):
     """Possible task status values."""
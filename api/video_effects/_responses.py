@@ -4,7 +4,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 from app.core.third_party_integrations.kling.api.video_effects._requests import (
     EffectType,
@@ -28,6 +28,8 @@ class TaskData(BaseModel):
         error: Error message if the task failed.
         metadata: Optional metadata associated with the task.
     """
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique task identifier")
     status: TaskStatus = Field(..., description="Current task status")
     effect_type: EffectType = Field(..., description="Type of effect applied")
@@ -48,6 +50,8 @@ class CreateTaskResponse(BaseModel):
         status: Initial status of the task.
         created_at: When the task was created.
     """
+    model_config = ConfigDict(frozen=True)
+
     task_id: str = Field(..., description="ID of the created task")
     status: TaskStatus = Field(..., description="Initial task status")
     created_at: datetime = Field(..., description="Task creation timestamp")
@@ -69,6 +73,8 @@ class ListTasksResponse(BaseModel):
         next_cursor: Pagination cursor for the next page of results.
         has_more: Whether there are more results available.
     """
+    model_config = ConfigDict(frozen=True)
+
     tasks: list[TaskData] = Field(default_factory=list, description="List of tasks")
     next_cursor: str | None = Field(None, description="Pagination cursor for next page")
     has_more: bool = Field(False, description="Whether more results are available")
@@ -82,6 +88,8 @@ class CancelTaskResponse(BaseModel):
         status: New status of the task (should be 'cancelled').
         cancelled_at: When the task was cancelled.
     """
+    model_config = ConfigDict(frozen=True)
+
     task_id: str = Field(..., description="ID of the cancelled task")
     status: Literal[TaskStatus.CANCELLED] = Field(..., description="Task status after cancellation")
     cancelled_at: datetime = Field(..., description="Cancellation timestamp")
@@ -1,16 +1,18 @@
 """Tests for the Kling AI Video Effects API client."""
 from __future__ import annotations
 
-import json
+import pickle
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 import httpx
+import orjson
 import pytest
 from pydantic import ValidationError
 
 from app.core.third_party_integrations.kling.api.video_effects._exceptions import (
     VideoEffectsError,
+    VideoEffectsNotFoundError,
     VideoEffectsRateLimitError,
     VideoEffectsValidationError,
 )
@@ -29,6 +31,11 @@ from app.core.third_party_integrations.kling.api.video_effects._responses import
 )
 
 
+def _response(status_code: int, payload: dict, headers: dict | None = None) -> httpx.Response:
+    """Build a real httpx.Response carrying a JSON payload."""
+    return httpx.Response(status_code, content=orjson.dumps(payload), headers=headers)
+
+
 class TestCreateTask:
     """Test the create_task method."""
     
@@ -40,10 +47,7 @@ class TestCreateTask:
     ):
         """Test successful task creation."""
         # Mock the API response
-        mock_client.request.return_value = AsyncMock(
-            status_code=200,
-            json=AsyncMock(return_value=create_task_response),
-        )
+        mock_client.request.return_value = _response(200, create_task_response)
         
         # Call the method
         response = await video_effects_api.create_task(
@@ -67,13 +71,14 @@ class TestCreateTask:
         assert args[1].endswith("/tasks")
         
         # Verify the request body
-        request_body = json.loads(kwargs["content"])
-        assert request_body["video_url"] == "https://example.com/video.mp4"
-        assert request_body["effect_type"] == "style_transfer"
-        assert request_body["style_reference"] == "https://example.com/style.jpg"
-        assert request_body["intensity"] == 0.8
-        assert request_body["quality"] == "high"
-        assert request_body["metadata"] == {"test": "value"}
+        assert orjson.loads(kwargs["content"]) == {
+            "video_url": "https://example.com/video.mp4",
+            "effect_type": "style_transfer",
+            "intensity": 0.8,
+            "quality": "high",
+            "style_reference": "https://example.com/style.jpg",
+            "metadata": {"test": "value"},
+        }
     
     async def test_create_task_validation_error(self, video_effects_api):
         """Test task creation with invalid data."""
@@ -90,10 +95,10 @@ class TestCreateTask:
     ):
         """Test rate limiting."""
         # Mock rate limit response
-        mock_client.request.return_value = AsyncMock(
-            status_code=429,
+        mock_client.request.return_value = _response(
+            429,
+            {"message": "Rate limit exceeded"},
             headers={"Retry-After": "1"},
-            json=AsyncMock(return_value={"message": "Rate limit exceeded"}),
         )
         
         # Should raise rate limit error
@@ -102,6 +107,56 @@ class TestCreateTask:
                 video_url="https://example.com/video.mp4",
                 effect_type=EffectType.STYLE_TRANSFER,
             )
+    
+    async def test_rate_limit_waits_at_least_retry_after(
+        self,
+        video_effects_api,
+        mock_client,
+    ):
+        """Test jitter never shortens the server's Retry-After."""
+        mock_client.request.return_value = _response(
+            429,
+            {"message": "Rate limit exceeded"},
+            headers={"Retry-After": "2"},
+        )
+        
+        with patch(
+            "app.core.third_party_integrations.kling.api.video_effects.video_effects.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as sleep, pytest.raises(VideoEffectsRateLimitError):
+            await video_effects_api.create_task(
+                video_url="https://example.com/video.mp4",
+                effect_type=EffectType.STYLE_TRANSFER,
+            )
+        
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert len(delays) == video_effects_api.max_retries
+        assert all(2 <= delay <= 2.4 for delay in delays)
+    
+    async def test_rate_limit_retry_after_http_date(
+        self,
+        video_effects_api,
+        mock_client,
+    ):
+        """Test an HTTP-date Retry-After is honoured rather than failing to parse."""
+        mock_client.request.return_value = _response(
+            429,
+            {"message": "Rate limit exceeded"},
+            headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+        
+        with patch(
+            "app.core.third_party_integrations.kling.api.video_effects.video_effects.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as sleep, pytest.raises(VideoEffectsRateLimitError):
+            await video_effects_api.create_task(
+                video_url="https://example.com/video.mp4",
+                effect_type=EffectType.STYLE_TRANSFER,
+            )
+        
+        # A date in the past means retry straight away
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert delays == [0.0] * video_effects_api.max_retries
 
 
 class TestGetTask:
@@ -115,10 +170,7 @@ class TestGetTask:
     ):
         """Test successful task retrieval."""
         # Mock the API response
-        mock_client.request.return_value = AsyncMock(
-            status_code=200,
-            json=AsyncMock(return_value=task_data),
-        )
+        mock_client.request.return_value = _response(200, task_data)
         
         # Call the method
         task_id = "test_task_123"
@@ -140,10 +192,7 @@ class TestGetTask:
     async def test_get_task_not_found(self, video_effects_api, mock_client):
         """Test task not found."""
         # Mock 404 response
-        mock_client.request.return_value = AsyncMock(
-            status_code=404,
-            json=AsyncMock(return_value={"message": "Task not found"}),
-        )
+        mock_client.request.return_value = _response(404, {"message": "Task not found"})
         
         # Should raise not found error
         with pytest.raises(VideoEffectsError) as exc_info:
@@ -163,10 +212,7 @@ class TestListTasks:
     ):
         """Test successful task listing."""
         # Mock the API response
-        mock_client.request.return_value = AsyncMock(
-            status_code=200,
-            json=AsyncMock(return_value=list_tasks_response),
-        )
+        mock_client.request.return_value = _response(200, list_tasks_response)
         
         # Call the method with filters
         response = await video_effects_api.list_tasks(
@@ -205,10 +251,7 @@ class TestCancelTask:
     ):
         """Test successful task cancellation."""
         # Mock the API response
-        mock_client.request.return_value = AsyncMock(
-            status_code=200,
-            json=AsyncMock(return_value=cancel_task_response),
-        )
+        mock_client.request.return_value = _response(200, cancel_task_response)
         
         # Call the method
         task_id = "test_task_123"
@@ -239,7 +282,7 @@ class TestRequestValidation:
             effect_type=EffectType.STYLE_TRANSFER,
             style_reference="https://example.com/style.jpg",
         )
-        assert valid_request.video_url == "https://example.com/video.mp4"
+        assert str(valid_request.video_url) == "https://example.com/video.mp4"
         assert valid_request.effect_type == EffectType.STYLE_TRANSFER
         
         # Invalid intensity
@@ -263,3 +306,65 @@ class TestRequestValidation:
                 video_url="not-a-url",
                 effect_type=EffectType.STYLE_TRANSFER,
             )
+        
+        # Bounds and URL format appear in the JSON schema
+        schema = CreateVideoEffectRequest.model_json_schema()["properties"]
+        assert schema["intensity"]["minimum"] == 0.0
+        assert schema["intensity"]["maximum"] == 1.0
+        assert schema["video_url"]["format"] == "uri"
+        
+        # Unhashable effect type
+        with pytest.raises(ValidationError):
+            CreateVideoEffectRequest(
+                video_url="https://example.com/video.mp4",
+                effect_type=["style_transfer"],
+            )
+
+
+class TestExceptions:
+    """Test the exception hierarchy."""
+    
+    def test_exception_pickle_round_trip(self):
+        """Test message and details survive pickling."""
+        error = pickle.loads(pickle.dumps(VideoEffectsNotFoundError("nope", details={"a": 1})))
+        assert type(error) is VideoEffectsNotFoundError
+        assert error.message == "nope"
+        assert error.details == {"a": 1}
+
+
+class TestBuildClient:
+    """Test the pooled client factory."""
+    
+    async def test_build_client_configuration(self):
+        """Test the built client carries auth headers and base URL."""
+        from app.core.third_party_integrations.kling.api.video_effects import VideoEffectsAPI
+        
+        client = VideoEffectsAPI.build_client(api_key="test_api_key")
+        try:
+            assert client.headers["Authorization"] == "Bearer test_api_key"
+            assert str(client.base_url).rstrip("/").endswith("/v1/video-effects")
+            assert client.timeout.connect == 5.0
+        finally:
+            await client.aclose()
+    
+    async def test_caller_client_left_untouched(self, task_data):
+        """Test a caller's shared client is never given our base URL or auth header."""
+        from app.core.third_party_integrations.kling.api.video_effects import VideoEffectsAPI
+        
+        sent = []
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, content=orjson.dumps(task_data))
+        
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            api = VideoEffectsAPI(client, api_key="test_api_key")
+            assert "Authorization" not in client.headers
+            assert str(client.base_url) == ""
+            
+            await api.get_task(task_data["id"])
+            await client.get("https://other-service.example.com/health")
+        
+        assert sent[0].url == f"https://api.kling.ai/v1/video-effects/tasks/{task_data['id']}"
+        assert sent[0].headers["Authorization"] == "Bearer test_api_key"
+        assert "Authorization" not in sent[1].headers
@@ -2,32 +2,37 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
 
 import httpx
-from pydantic import ValidationError
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from app.core.third_party_integrations.kling.api.video_effects._exceptions import (
     VideoEffectsConnectionError,
     VideoEffectsError,
-    VideoEffectsNotFoundError,
     VideoEffectsRateLimitError,
-    VideoEffectsServerError,
     VideoEffectsTimeoutError,
-    VideoEffectsUnauthorizedError,
     VideoEffectsValidationError,
+    map_http_error,
 )
 from app.core.third_party_integrations.kling.api.video_effects._requests import (
     CreateVideoEffectRequest,
-    ListTasksRequest,
+    EffectType,
     TaskStatus,
+    VideoQuality,
 )
 from app.core.third_party_integrations.kling.api.video_effects._responses import (
     CancelTaskResponse,
     CreateTaskResponse,
     GetTaskResponse,
     ListTasksResponse,
+    TaskData,
 )
 
 logger = logging.getLogger(__name__)
@@ -35,6 +40,96 @@ logger = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_RETRIES = 3
 DEFAULT_BASE_URL = "https://api.kling.ai/v1/video-effects"
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+# Longer than httpx's 5s default so connections survive between task polls
+DEFAULT_KEEPALIVE_EXPIRY = 15.0
+DEFAULT_MAX_CONCURRENCY = 20
+# Bounds for the jittered retry backoff, in seconds
+_BACKOFF_BASE = 0.1
+_BACKOFF_CAP = 10.0
+# Wait used when a 429 carries no usable Retry-After header, in seconds
+_DEFAULT_RETRY_AFTER = 1.0
+
+
+def _parse_retry_after(value: str | None) -> float:
+    """Parse a Retry-After header given in seconds or as an HTTP-date."""
+    if value is None:
+        return _DEFAULT_RETRY_AFTER
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return _DEFAULT_RETRY_AFTER
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _default_headers(api_key: str | None) -> dict[str, str]:
+    """Build the headers sent with every Video Effects API request."""
+    headers = {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+    return headers
+
+
+
+# Built once so each response is validated against a cached core schema
+# straight from the JSON bytes, without an intermediate dict.
+_CREATE_ADAPTER = TypeAdapter(CreateTaskResponse)
+_GET_ADAPTER = TypeAdapter(GetTaskResponse)
+# Validates the whole page, nested TaskData items included, in a single
+# pydantic-core pass; splitting the tasks out into a list[TaskData] adapter
+# measured slower because it needs the orjson dict first.
+_LIST_ADAPTER = TypeAdapter(ListTasksResponse)
+_CANCEL_ADAPTER = TypeAdapter(CancelTaskResponse)
+
+
+def _dump_create(request: CreateVideoEffectRequest) -> bytes:
+    """Serialise a create request to the JSON body sent to the API."""
+    return orjson.dumps(request.model_dump(mode="json", exclude_none=True))
+
+
+def _freeze_metadata(metadata: dict[str, str] | None) -> tuple[tuple[str, str], ...] | None:
+    """Turn metadata into a hashable form for use as a cache key."""
+    return None if metadata is None else tuple(sorted(metadata.items()))
+
+
+@functools.lru_cache(maxsize=1024)
+def _serialize_create(
+    video_url: str,
+    effect_type: EffectType | str,
+    intensity: float,
+    quality: VideoQuality | str,
+    style_reference: str | None,
+    callback_url: str | None,
+    metadata: tuple[tuple[str, str], ...] | None,
+) -> bytes:
+    """Validate and serialise a create_task body, memoised on its arguments."""
+    return _dump_create(CreateVideoEffectRequest(
+        video_url=video_url,
+        effect_type=effect_type,
+        intensity=intensity,
+        quality=quality,
+        style_reference=style_reference,
+        callback_url=callback_url,
+        metadata=None if metadata is None else dict(metadata),
+    ))
+
+
+# model_construct skips validators, so the trusted path is only taken for
+# models that declare none of their own.
+_CONSTRUCT_SAFE = not any(
+    model.__pydantic_decorators__.field_validators or model.__pydantic_decorators__.model_validators
+    for model in (GetTaskResponse, ListTasksResponse, TaskData)
+)
 
 
 class VideoEffectsAPI:
@@ -42,13 +137,19 @@ class VideoEffectsAPI:
     
     This class provides methods to interact with the Kling AI Video Effects API,
     including creating tasks, checking status, and listing tasks.
+
+    The HTTP client should be long-lived and shared, ideally one built by
+    :meth:`build_client`, so task polling reuses pooled keep-alive
+    connections instead of opening a new TLS session per request. That
+    client speaks HTTP/2, so concurrent calls such as
+    ``asyncio.gather(*(api.get_task(t) for t in task_ids))`` are multiplexed
+    over one connection; share a single instance per process to keep it warm.
     
     Example:
         ```python
-        import httpx
         from app.core.third_party_integrations.kling.api.video_effects import VideoEffectsAPI
         
-        async with httpx.AsyncClient() as client:
+        async with VideoEffectsAPI.build_client(api_key="your-api-key") as client:
             api = VideoEffectsAPI(client, api_key="your-api-key")
             
             # Create a new task
@@ -71,6 +172,8 @@ class VideoEffectsAPI:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_RETRIES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        trust_server: bool = False,
     ) -> None:
         """Initialize the VideoEffectsAPI client.
         
@@ -80,27 +183,70 @@ class VideoEffectsAPI:
             base_url: Base URL for the API. Defaults to production API.
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retries for failed requests.
+            max_concurrency: Maximum number of requests this instance keeps in
+                flight at once; extra calls queue locally instead of at the API.
+            trust_server: Build ``get_task``/``list_tasks`` results with
+                ``model_construct`` instead of validating them. Fields keep
+                their raw JSON types (e.g. timestamps stay strings).
         """
         self.client = client
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+        self._rate_gate = asyncio.Semaphore(max_concurrency)
+        self._trust_server = trust_server and _CONSTRUCT_SAFE
         
-        # Set default headers
-        self._headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-        if self.api_key:
-            self._headers["Authorization"] = f"Bearer {self.api_key}"
+        # Set default headers; kept as httpx.Headers so httpx doesn't
+        # re-normalise a plain dict on every request
+        self._headers = httpx.Headers(_default_headers(self.api_key))
+        
+        # The client is never modified: it may be shared with other services.
+        # Requests go out as bare endpoint paths only when it already carries
+        # our base URL and headers (as one from build_client does); otherwise
+        # _request joins the URL and sends the headers per call.
+        self._client_configured = str(client.base_url).rstrip("/") == self.base_url and all(
+            client.headers.get(name) == value for name, value in self._headers.items()
+        )
+
+    @staticmethod
+    def build_client(
+        api_key: str | None = None,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> httpx.AsyncClient:
+        """Build an HTTPX client tuned for polling the Video Effects API.
+
+        The client keeps a pool of keep-alive connections open long enough to
+        span typical polling intervals and negotiates HTTP/2, so concurrent
+        requests are multiplexed over a single connection.
+
+        Args:
+            api_key: Kling AI API key to send as a Bearer token.
+            base_url: Base URL for the API. Defaults to production API.
+            timeout: Request timeout in seconds.
+
+        Returns:
+            A configured ``httpx.AsyncClient``; the caller is responsible for closing it.
+        """
+        return httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers=_default_headers(api_key),
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=DEFAULT_MAX_CONNECTIONS,
+                max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+            ),
+            http2=True,
+        )
     
     async def _request(
         self,
         method: str,
         endpoint: str,
         **kwargs: Any,
-    ) -> dict[str, Any] | None:
+    ) -> bytes | None:
         """Make an HTTP request with retry logic.
         
         Args:
@@ -109,7 +255,7 @@ class VideoEffectsAPI:
             **kwargs: Additional arguments to pass to httpx request
             
         Returns:
-            Parsed JSON response as a dictionary
+            Raw JSON response body, or None for 204 responses
             
         Raises:
             VideoEffectsError: For request errors
@@ -121,35 +267,52 @@ class VideoEffectsAPI:
             VideoEffectsTimeoutError: For request timeouts
             VideoEffectsConnectionError: For connection errors
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = {**self._headers, **kwargs.pop("headers", {})}
+        if self._client_configured:
+            # The client resolves the path and applies its default headers
+            url = endpoint
+            headers = kwargs.pop("headers", None)
+        else:
+            url = f"{self.base_url}/{endpoint.lstrip('/')}"
+            extra_headers = kwargs.pop("headers", None)
+            if extra_headers is None:
+                headers = self._headers
+            else:
+                headers = self._headers.copy()
+                headers.update(extra_headers)
         
         last_exception = None
         
         for attempt in range(self.max_retries + 1):
             try:
-                response = await self.client.request(
-                    method,
-                    url,
-                    headers=headers,
-                    timeout=self.timeout,
-                    **kwargs,
-                )
+                async with self._rate_gate:
+                    response = await self.client.request(
+                        method,
+                        url,
+                        headers=headers,
+                        timeout=self.timeout,
+                        **kwargs,
+                    )
                 
                 # Handle successful response
                 if 200 <= response.status_code < 300:
                     if response.status_code == 204:  # No content
                         return None
-                    return response.json()
+                    return response.content
                 
                 # Handle errors
-                error_data = response.json() if response.content else {}
+                try:
+                    error_data = orjson.loads(response.content) if response.content else {}
+                except orjson.JSONDecodeError:
+                    # Non-JSON error pages (e.g. from a proxy) still map by status
+                    error_data = {"raw": response.text}
                 
                 # Rate limiting - check for Retry-After header
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", "1"))
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
                     if attempt < self.max_retries:
-                        await asyncio.sleep(retry_after)
+                        # Jitter upwards only, so concurrent callers spread out
+                        # without retrying before the server said to
+                        await asyncio.sleep(retry_after + random.uniform(0, 0.2 * retry_after))
                         continue
                     
                     raise VideoEffectsRateLimitError(
@@ -158,16 +321,7 @@ class VideoEffectsAPI:
                     )
                 
                 # Map other HTTP errors to specific exceptions
-                if response.status_code == 400:
-                    raise VideoEffectsValidationError("Invalid request", details=error_data)
-                elif response.status_code == 401:
-                    raise VideoEffectsUnauthorizedError("Authentication failed", details=error_data)
-                elif response.status_code == 404:
-                    raise VideoEffectsNotFoundError("Resource not found", details=error_data)
-                elif 500 <= response.status_code < 600:
-                    raise VideoEffectsServerError("Server error occurred", details=error_data)
-                else:
-                    raise VideoEffectsError("API request failed", details=error_data)
+                raise map_http_error(response.status_code, error_data)
                 
             except httpx.TimeoutException as e:
                 last_exception = VideoEffectsTimeoutError(f"Request timed out: {e}")
@@ -186,21 +340,42 @@ class VideoEffectsAPI:
                 if attempt == self.max_retries:
                     raise last_exception
             
-            # Exponential backoff
-            await asyncio.sleep(2 ** attempt * 0.1)
+            # Exponential backoff with full jitter
+            await asyncio.sleep(
+                random.uniform(_BACKOFF_BASE, min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** attempt))
+            )
         
         # This should never be reached due to the raises above
         raise last_exception or VideoEffectsError("Unknown error occurred")
     
-    async def create_task(self, **kwargs: Any) -> CreateTaskResponse:
+    async def create_task(
+        self,
+        *,
+        video_url: str,
+        effect_type: EffectType | str,
+        intensity: float = 0.5,
+        quality: VideoQuality | str = VideoQuality.HIGH,
+        style_reference: str | None = None,
+        callback_url: str | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> CreateTaskResponse:
         """Create a new video effect task.
         
         Args:
-            **kwargs: Arguments to pass to CreateVideoEffectRequest
+            video_url: URL of the source video
+            effect_type: Type of effect to apply
+            intensity: Effect intensity (0.0 to 1.0)
+            quality: Output video quality preset
+            style_reference: Reference image URL for style transfer
+            callback_url: URL to receive webhook callbacks
+            metadata: Optional metadata to associate with the task
             
         Returns:
             CreateTaskResponse with task details
             
+        Raises:
+            ValidationError: If the arguments fail CreateVideoEffectRequest validation
+            
         Example:
             ```python
             task = await api.create_task(
@@ -211,11 +386,29 @@ class VideoEffectsAPI:
             ```
         """
         try:
-            request = CreateVideoEffectRequest(**kwargs)
-            data = await self._request("POST", "/tasks", json=request.model_dump(exclude_none=True))
-            return CreateTaskResponse(**data)
-        except ValidationError as e:
-            raise VideoEffectsValidationError("Invalid request parameters", details={"errors": e.errors()}) from e
+            # Batch jobs tend to repeat identical bodies, so reuse the bytes
+            body = _serialize_create(
+                video_url,
+                effect_type,
+                intensity,
+                quality,
+                style_reference,
+                callback_url,
+                _freeze_metadata(metadata),
+            )
+        except TypeError:
+            # Unhashable arguments (e.g. nested metadata) can't be memoised
+            body = _dump_create(CreateVideoEffectRequest(
+                video_url=video_url,
+                effect_type=effect_type,
+                intensity=intensity,
+                quality=quality,
+                style_reference=style_reference,
+                callback_url=callback_url,
+                metadata=metadata,
+            ))
+        data = await self._request("POST", "/tasks", content=body)
+        return _CREATE_ADAPTER.validate_json(data)
     
     async def get_task(self, task_id: str) -> GetTaskResponse:
         """Get the status of a video effect task.
@@ -230,7 +423,9 @@ class VideoEffectsAPI:
             VideoEffectsNotFoundError: If the task is not found
         """
         data = await self._request("GET", f"/tasks/{task_id}")
-        return GetTaskResponse(**data)
+        if self._trust_server:
+            return GetTaskResponse.model_construct(**orjson.loads(data))
+        return _GET_ADAPTER.validate_json(data)
     
     async def list_tasks(
         self,
@@ -247,14 +442,34 @@ class VideoEffectsAPI:
             
         Returns:
             ListTasksResponse with matching tasks and pagination info
+            
+        Raises:
+            VideoEffectsValidationError: If ``limit`` or ``status`` is invalid
         """
-        try:
-            request = ListTasksRequest(status=status, limit=limit, cursor=cursor)
-            params = {k: v for k, v in request.model_dump().items() if v is not None}
-            data = await self._request("GET", "/tasks", params=params)
-            return ListTasksResponse(**data)
-        except ValidationError as e:
-            raise VideoEffectsValidationError("Invalid request parameters", details={"errors": e.errors()}) from e
+        if not 1 <= limit <= 100:
+            raise VideoEffectsValidationError(
+                "Invalid request parameters", details={"limit": "must be between 1 and 100"}
+            )
+        params: dict[str, Any] = {"limit": limit}
+        if status is not None:
+            try:
+                params["status"] = TaskStatus(status).value
+            except ValueError as e:
+                raise VideoEffectsValidationError(
+                    "Invalid request parameters", details={"status": str(e)}
+                ) from e
+        if cursor is not None:
+            params["cursor"] = cursor
+        
+        data = await self._request("GET", "/tasks", params=params)
+        if self._trust_server:
+            payload = orjson.loads(data)
+            return ListTasksResponse.model_construct(
+                tasks=[TaskData.model_construct(**task) for task in payload.get("tasks", [])],
+                next_cursor=payload.get("next_cursor"),
+                has_more=payload.get("has_more", False),
+            )
+        return _LIST_ADAPTER.validate_json(data)
     
     async def cancel_task(self, task_id: str) -> CancelTaskResponse:
         """Cancel a video effect task.
@@ -270,4 +485,4 @@ class VideoEffectsAPI:
             VideoEffectsValidationError: If the task cannot be cancelled
         """
         data = await self._request("POST", f"/tasks/{task_id}/cancel")
-        return CancelTaskResponse(**data)
+        return _CANCEL_ADAPTER.validate_json(data)
@@ -34,7 +34,7 @@ from ._exceptions import (
     VideoExtensionAuthenticationError,
     handle_video_extension_error,
 )
-from ._requests import VideoExtensionRequest, TaskListQueryParams, TaskStatus
+from ._requests import VideoExtensionRequest, TaskListQueryParams, TaskStatus, build_task_list_qs
 from ._responses import (
     VideoExtensionResponse,
     TaskStatusResponse,
@@ -44,16 +44,18 @@ from ._responses import (
     TaskResult,
     TaskInfo,
 )
-from .video_extension import VideoExtensionAPI
+from .video_extension import VideoExtensionAPI, get_video_extension_api
 
 __all__ = [
     # Main client
     "VideoExtensionAPI",
+    "get_video_extension_api",
     
     # Requests
     "VideoExtensionRequest",
     "TaskListQueryParams",
     "TaskStatus",
+    "build_task_list_qs",
     
     # Responses
     "VideoExtensionResponse",
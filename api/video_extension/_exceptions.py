@@ -20,7 +20,10 @@ class VideoExtensionValidationError(VideoExtensionError):
 
 class VideoExtensionRateLimitError(VideoExtensionError):
     """Raised when rate limit is exceeded for video extension API."""
-    pass
+
+    def __init__(self, *args: Any, retry_after: float | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.retry_after = retry_after
 
 
 class VideoExtensionNotFoundError(VideoExtensionError):
@@ -43,6 +46,17 @@ class VideoExtensionAuthenticationError(VideoExtensionError):
     pass
 
 
+# Error codes that map directly to an exception class and message prefix
+_ERROR_CODE_MAP: dict[int, tuple[type[VideoExtensionError], str]] = {
+    400: (VideoExtensionValidationError, "Validation error"),
+    422: (VideoExtensionValidationError, "Validation error"),
+    401: (VideoExtensionAuthenticationError, "Authentication failed"),
+    403: (VideoExtensionAuthenticationError, "Authentication failed"),
+    404: (VideoExtensionNotFoundError, "Resource not found"),
+    429: (VideoExtensionRateLimitError, "Rate limit exceeded"),
+}
+
+
 def handle_video_extension_error(error: dict[str, Any] | None = None) -> None:
     """Handle API errors and raise appropriate exceptions.
 
@@ -63,22 +77,10 @@ def handle_video_extension_error(error: dict[str, Any] | None = None) -> None:
     error_code = error.get("code", -1)
     error_message = error.get("message", "Unknown error occurred")
 
-    if error_code in (400, 422):
-        raise VideoExtensionValidationError(
-            f"Validation error: {error_message}", status_code=error_code
-        )
-    if error_code in (401, 403):
-        raise VideoExtensionAuthenticationError(
-            f"Authentication failed: {error_message}", status_code=error_code
-        )
-    if error_code == 404:
-        raise VideoExtensionNotFoundError(
-            f"Resource not found: {error_message}", status_code=error_code
-        )
-    if error_code == 429:
-        raise VideoExtensionRateLimitError(
-            f"Rate limit exceeded: {error_message}", status_code=error_code
-        )
+    mapped = _ERROR_CODE_MAP.get(error_code)
+    if mapped is not None:
+        error_cls, prefix = mapped
+        raise error_cls(f"{prefix}: {error_message}", status_code=error_code)
     if 500 <= error_code < 600:
         raise VideoExtensionServerError(
             f"Server error: {error_message}", status_code=error_code
@@ -4,6 +4,7 @@ Request models for the Kling AI Video Extension API.
 from __future__ import annotations
 
 from enum import Enum
+from urllib.parse import urlencode
 
 from pydantic import BaseModel, Field, HttpUrl
 
@@ -84,4 +85,26 @@ class TaskListQueryParams(BaseModel):
 
     def to_query_string(self) -> str:
         """Convert query parameters to URL query string."""
-        return f"pageNum={self.page_num}&pageSize={self.page_size}"
+        return build_task_list_qs(self.page_num, self.page_size)
+
+
+def build_task_list_qs(page_num: int = 1, page_size: int = 30) -> str:
+    """Build the task-list query string without instantiating TaskListQueryParams.
+
+    Applies the same bounds as :class:`TaskListQueryParams`.
+
+    Args:
+        page_num: Page number (1-1000)
+        page_size: Number of items per page (1-500)
+
+    Returns:
+        URL-encoded query string using the API's camelCase parameter names
+
+    Raises:
+        ValueError: If either value is out of range
+    """
+    if not 1 <= page_num <= 1000:
+        raise ValueError(f"page_num must be between 1 and 1000, got {page_num}")
+    if not 1 <= page_size <= 500:
+        raise ValueError(f"page_size must be between 1 and 500, got {page_size}")
+    return urlencode({"pageNum": page_num, "pageSize": page_size})
@@ -5,13 +5,15 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field, HttpUrl, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_serializer
 
 from ._requests import TaskStatus
 
 
 class VideoInfo(BaseModel):
     """Information about a video."""
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique video ID")
     url: HttpUrl | None = Field(None, description="URL of the video")
     duration: float | None = Field(None, description="Duration in seconds")
@@ -23,12 +25,16 @@ class VideoInfo(BaseModel):
 
 class TaskInfo(BaseModel):
     """Information about a video extension task."""
+    model_config = ConfigDict(frozen=True)
+
     parent_video: VideoInfo = Field(..., description="Original video information")
     # Add other task info fields as needed
 
 
 class VideoResult(BaseModel):
     """Result of a video generation task."""
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Generated video ID")
     url: HttpUrl | None = Field(None, description="URL of the generated video")
     seed: str | None = Field(None, description="Random seed used for generation")
@@ -76,6 +82,8 @@ class VideoExtensionTaskData(BaseModel):
 
 class TaskStatusData(BaseModel):
     """Data model for task status response."""
+    model_config = ConfigDict(frozen=True)
+
     task_id: str = Field(..., description="Unique task ID")
     task_status: TaskStatus = Field(..., description="Current task status")
     task_status_msg: str | None = Field(
@@ -5,19 +5,16 @@ This module provides an async client for interacting with the Kling AI Video Ext
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-from typing import Any
+import random
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable
 
 import httpx
-from pydantic import ValidationError
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+import orjson
+from pydantic import BaseModel, ValidationError
 
-from app.core.third_party_integrations.kling.client import KlingClient
 from app.core.third_party_integrations.kling.models.video_extension import (
     VideoExtensionRequest,
     VideoExtensionResponse,
@@ -31,9 +28,11 @@ from ._exceptions import (
     VideoExtensionValidationError,
     handle_video_extension_error,
 )
-from ._requests import TaskListQueryParams, TaskStatus
+from ._requests import TaskStatus, build_task_list_qs
 from ._responses import TaskStatusData, TaskStatusResponse
 
+if TYPE_CHECKING:
+    from app.core.third_party_integrations.kling.client import KlingClient
 logger = logging.getLogger(__name__)
 
 # Default retry configuration
@@ -42,6 +41,56 @@ DEFAULT_RETRY_MULTIPLIER = 1
 DEFAULT_RETRY_MIN = 1
 DEFAULT_RETRY_MAX = 10
 
+# Highest page number the task-list endpoint accepts
+_MAX_PAGE_NUM = 1000
+
+# Polling and scans reuse a handful of (page_num, page_size) pairs; the
+# query string is immutable, so cache it outright
+_list_query = functools.lru_cache(maxsize=256)(build_task_list_qs)
+
+_TERMINAL_STATUSES: frozenset[TaskStatus] = frozenset({TaskStatus.SUCCEED, TaskStatus.FAILED})
+
+# Errors worth another attempt; everything else is raised immediately
+_RETRYABLE_ERRORS = (
+    VideoExtensionRateLimitError,
+    VideoExtensionServerError,
+    VideoExtensionTimeoutError,
+)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class _TaskListEnvelope(BaseModel):
+    """The part of a task-list response that list_tasks returns."""
+    data: list[TaskStatusData]
+
+
+class _TaskStatusOnly(BaseModel):
+    """The status field of a task; the rest of the task object is ignored."""
+    task_status: TaskStatus
+
+
+class _TaskStatusEnvelope(BaseModel):
+    """Just the status of a task-status response; everything else is skipped."""
+    data: _TaskStatusOnly
+
+
+# Bound once at import so the hot paths skip attribute lookups per call.
+# Responses are validated straight from the body bytes, so a whole page of
+# tasks goes bytes -> models in one pydantic-core pass.
+_CREATE_RESPONSE_VALIDATE = VideoExtensionResponse.model_validate_json
+_TASK_STATUS_VALIDATE = TaskStatusResponse.model_validate_json
+_TASK_LIST_VALIDATE = _TaskListEnvelope.model_validate_json
+_TASK_STATUS_ONLY_VALIDATE = _TaskStatusEnvelope.model_validate_json
+
 
 class VideoExtensionAPI:
     """Client for interacting with the Kling AI Video Extension API.
@@ -56,10 +105,12 @@ class VideoExtensionAPI:
         """Initialize the VideoExtensionAPI client.
 
         Args:
-            client: Authenticated httpx.AsyncClient instance from KlingClient
+            client: Authenticated httpx.AsyncClient instance from KlingClient;
+                its ``base_url`` resolves the relative endpoint paths used here
         """
         self._client = client
-        self._base_url = str(client.base_url).rstrip("/")
+        # get_task calls currently awaiting a response, keyed by task ID
+        self._inflight: dict[str, asyncio.Future[TaskStatusResponse]] = {}
     
     async def create_task(
         self,
@@ -89,25 +140,21 @@ class VideoExtensionAPI:
             response = await self._make_request(
                 "POST",
                 self.BASE_PATH,
-                json=request.model_dump(exclude_none=True),
+                content=request.model_dump_json(exclude_none=True),
                 **kwargs,
             )
             
-            # Validate and parse the response
-            if not isinstance(response, dict):
-                raise VideoExtensionValidationError("Invalid response format: expected dictionary")
-                
-            return VideoExtensionResponse.model_validate(response)
+            return _CREATE_RESPONSE_VALIDATE(response)
             
         except ValidationError as e:
-            logger.error(f"Request/Response validation error: {e}")
+            logger.error("Request/Response validation error: %s", e)
             raise VideoExtensionValidationError(f"Validation error: {e}") from e
             
         except VideoExtensionValidationError:
             raise
             
         except Exception as e:
-            logger.error(f"Failed to create video extension task: {e}")
+            logger.error("Failed to create video extension task: %s", e)
             raise VideoExtensionError(f"Failed to create task: {str(e)}") from e
     
     async def get_task(
@@ -117,6 +164,9 @@ class VideoExtensionAPI:
     ) -> TaskStatusResponse:
         """Get the status of a video extension task.
 
+        Concurrent calls for the same ``task_id`` (without extra request
+        arguments) share a single in-flight request.
+
         Args:
             task_id: ID of the task to retrieve
             **kwargs: Additional arguments to pass to the request
@@ -128,6 +178,23 @@ class VideoExtensionAPI:
             VideoExtensionValidationError: If task_id is invalid
             VideoExtensionError: If task is not found or other errors occur
         """
+        if kwargs:
+            return await self._get_task(task_id, **kwargs)
+        
+        inflight = self._inflight.get(task_id)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._get_task(task_id))
+            self._inflight[task_id] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(task_id, None))
+        # Shielded so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(inflight)
+
+    async def _get_task(
+        self,
+        task_id: str,
+        **kwargs: Any,
+    ) -> TaskStatusResponse:
+        """Fetch and validate a task's status; see :meth:`get_task`."""
         try:
             # Validate task_id
             if not task_id or not isinstance(task_id, str):
@@ -139,23 +206,15 @@ class VideoExtensionAPI:
                 **kwargs,
             )
             
-            # Validate and parse the response
-            if not isinstance(response, dict):
-                raise VideoExtensionValidationError("Invalid response format: expected dictionary")
-                
-            status_response = TaskStatusResponse.model_validate(response)
+            status_response = _TASK_STATUS_VALIDATE(response)
             
-            # Log status transition if available
-            if hasattr(status_response, 'data') and hasattr(status_response.data, 'task_status'):
+            # Log status transition; skipped entirely when INFO is disabled
+            if logger.isEnabledFor(logging.INFO):
                 task_status = status_response.data.task_status
-                logger.info(
-                    "Task %s status: %s",
-                    task_id,
-                    task_status.value if hasattr(task_status, 'value') else task_status
-                )
+                logger.info("Task %s status: %s", task_id, task_status.value)
                 
                 # Check for terminal states
-                if task_status in (TaskStatus.SUCCEED, TaskStatus.FAILED):
+                if task_status in _TERMINAL_STATUSES:
                     logger.info(
                         "Task %s reached terminal state: %s",
                         task_id,
@@ -165,16 +224,41 @@ class VideoExtensionAPI:
             return status_response
             
         except ValidationError as e:
-            logger.error(f"Response validation error: {e}")
+            logger.error("Response validation error: %s", e)
             raise VideoExtensionValidationError(f"Invalid response data: {e}") from e
             
         except VideoExtensionValidationError:
             raise
             
         except Exception as e:
-            logger.error(f"Failed to get task {task_id}: {e}")
+            logger.error("Failed to get task %s: %s", task_id, e)
             raise VideoExtensionError(f"Failed to retrieve task: {str(e)}") from e
     
+    async def get_task_status(self, task_id: str, **kwargs: Any) -> TaskStatus:
+        """Get only the current status of a video extension task.
+
+        Cheaper than :meth:`get_task` for polling loops: the nested task
+        info and results are not validated or built.
+
+        Args:
+            task_id: ID of the task to check
+            **kwargs: Additional arguments to pass to the request
+
+        Returns:
+            The task's current status
+
+        Raises:
+            VideoExtensionValidationError: If task_id or the response is invalid
+            VideoExtensionError: If task is not found or other errors occur
+        """
+        if not task_id or not isinstance(task_id, str):
+            raise VideoExtensionValidationError("task_id must be a non-empty string")
+        response = await self._make_request("GET", f"{self.BASE_PATH}/{task_id}", **kwargs)
+        try:
+            return _TASK_STATUS_ONLY_VALIDATE(response).data.task_status
+        except ValidationError as e:
+            raise VideoExtensionValidationError(f"Invalid response data: {e}") from e
+
     async def list_tasks(
         self,
         page_num: int = 1,
@@ -196,14 +280,10 @@ class VideoExtensionAPI:
             VideoExtensionError: If request fails or response is invalid
         """
         try:
-            # Create and validate query parameters
+            # Validate and encode query parameters
             try:
-                query = TaskListQueryParams(
-                    page_num=page_num,
-                    page_size=page_size,
-                )
-                query_dict = query.model_dump(exclude_none=True)
-            except ValidationError as e:
+                query_string = _list_query(page_num, page_size)
+            except ValueError as e:
                 raise VideoExtensionValidationError(
                     f"Invalid pagination parameters: {str(e)}"
                 ) from e
@@ -217,56 +297,113 @@ class VideoExtensionAPI:
             # Make the request with query parameters
             response = await self._make_request(
                 "GET",
-                self.BASE_PATH,
-                params=query_dict,
+                f"{self.BASE_PATH}?{query_string}",
                 **kwargs,
             )
             
-            # Validate and parse the response
-            if not isinstance(response, dict) or "data" not in response:
-                raise VideoExtensionValidationError("Invalid response format: missing 'data' field")
-                
-            # Return a list of TaskStatusData objects
-            return [TaskStatusData.model_validate(item) for item in response["data"]]
+            # A missing or malformed 'data' field surfaces as a ValidationError
+            return _TASK_LIST_VALIDATE(response).data
             
         except ValidationError as e:
-            logger.error(f"Response validation error: {e}")
+            logger.error("Response validation error: %s", e)
             raise VideoExtensionValidationError(f"Invalid response data: {e}") from e
             
         except VideoExtensionValidationError:
             raise
             
         except Exception as e:
-            logger.error(f"Failed to list tasks: {e}")
+            logger.error("Failed to list tasks: %s", e)
             raise VideoExtensionError(f"Failed to list tasks: {str(e)}") from e
     
-    @retry(
-        stop=stop_after_attempt(DEFAULT_RETRY_ATTEMPTS),
-        wait=wait_exponential(
-            multiplier=DEFAULT_RETRY_MULTIPLIER,
-            min=DEFAULT_RETRY_MIN,
-            max=DEFAULT_RETRY_MAX,
-        ),
-        retry=retry_if_exception_type(
-            (VideoExtensionRateLimitError, VideoExtensionServerError, httpx.RequestError)
-        ),
-        reraise=True,
-    )
+    async def list_tasks_pages(
+        self,
+        page_nums: Iterable[int],
+        page_size: int = 30,
+        concurrency: int = 8,
+        **kwargs: Any,
+    ) -> list[list[TaskStatusData]]:
+        """Fetch several task-list pages concurrently.
+
+        At most ``concurrency`` requests are in flight at once, so N pages
+        take roughly N / concurrency round trips instead of N.
+
+        Args:
+            page_nums: Page numbers to fetch (1-based)
+            page_size: Number of items per page (1-500)
+            concurrency: Maximum number of pages requested at the same time
+            **kwargs: Additional arguments to pass to each request
+
+        Returns:
+            One list of task status data objects per requested page, in the
+            order of ``page_nums``
+
+        Raises:
+            ValueError: If ``concurrency`` is less than 1
+            VideoExtensionValidationError: If pagination parameters are invalid
+            VideoExtensionError: If any page request fails
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page_num: int) -> list[TaskStatusData]:
+            async with semaphore:
+                return await self.list_tasks(page_num=page_num, page_size=page_size, **kwargs)
+
+        return list(await asyncio.gather(*(fetch(page_num) for page_num in page_nums)))
+
+    async def iter_tasks(
+        self,
+        *,
+        page_size: int = 100,
+        start_page: int = 1,
+        **kwargs: Any,
+    ) -> AsyncIterator[TaskStatusData]:
+        """Iterate over video extension tasks one at a time, fetching pages lazily.
+
+        Only one page is held in memory at a time, and breaking out of the
+        loop stops further requests.
+
+        Args:
+            page_size: Number of items per page (1-500)
+            start_page: Page number to start from (1-based)
+            **kwargs: Additional arguments to pass to each request
+
+        Yields:
+            Task status data objects, in API order
+
+        Raises:
+            VideoExtensionValidationError: If pagination parameters are invalid
+            VideoExtensionError: If a page request fails
+        """
+        page_num = start_page
+        while True:
+            tasks = await self.list_tasks(page_num=page_num, page_size=page_size, **kwargs)
+            for task in tasks:
+                yield task
+            if len(tasks) < page_size or page_num >= _MAX_PAGE_NUM:
+                return
+            page_num += 1
+
     async def _make_request(
         self,
         method: str,
         url: str,
         **kwargs: Any,
-    ) -> dict[str, Any]:
+    ) -> bytes:
         """Make an HTTP request to the Kling AI API with retry logic.
         
+        Rate-limit, server and timeout errors are retried with capped
+        exponential backoff plus jitter, honouring ``Retry-After`` when the
+        API sends one.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             url: API endpoint URL
             **kwargs: Additional arguments to pass to the request
             
         Returns:
-            Parsed JSON response
+            Raw JSON response body
             
         Raises:
             VideoExtensionError: For request/response handling errors
@@ -274,31 +411,52 @@ class VideoExtensionAPI:
             VideoExtensionServerError: For server errors (5xx)
             VideoExtensionTimeoutError: If request times out
         """
+        for attempt in range(DEFAULT_RETRY_ATTEMPTS):
+            try:
+                return await self._send(method, url, **kwargs)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == DEFAULT_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = min(
+                    DEFAULT_RETRY_MAX,
+                    max(DEFAULT_RETRY_MIN, DEFAULT_RETRY_MULTIPLIER * 2 ** attempt),
+                ) + random.uniform(0, 0.5)
+                retry_after = getattr(e, "retry_after", None)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                logger.debug("Retrying %s %s in %.2fs after: %s", method, url, delay, e)
+                await asyncio.sleep(delay)
+        raise VideoExtensionError(f"Request failed after {DEFAULT_RETRY_ATTEMPTS} attempts")
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> bytes:
+        """Send a single request and map failures to video extension errors."""
         try:
-            # Ensure URL is absolute
-            if not url.startswith("http"):
-                url = f"{self._base_url}{url}"
-            
-            logger.debug(f"Making {method} request to {url}")
+            logger.debug("Making %s request to %s", method, url)
             
-            async with self._client as client:
-                response = await client.request(method, url, **kwargs)
-                response.raise_for_status()
-                return response.json()
+            # The client is shared and owned by KlingClient; entering it as a
+            # context manager here would close its connection pool on exit.
+            response = await self._client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response.content
                 
         except httpx.TimeoutException as e:
-            logger.error(f"Request timed out: {e}")
+            logger.error("Request timed out: %s", e)
             raise VideoExtensionTimeoutError(f"Request timed out: {e}") from e
             
         except httpx.HTTPStatusError as e:
             error_data = {}
             try:
-                error_data = e.response.json()
+                error_data = orjson.loads(e.response.content)
             except Exception:
                 pass
                 
             status_code = e.response.status_code
-            logger.error(f"HTTP error {status_code} for {method} {url}: {error_data}")
+            logger.error("HTTP error %s for %s %s: %s", status_code, method, url, error_data)
             
             # Handle rate limiting
             if status_code == 429:
@@ -306,12 +464,9 @@ class VideoExtensionAPI:
                 raise VideoExtensionRateLimitError(
                     f"Rate limit exceeded. Retry after: {retry_after}s",
                     status_code=status_code,
+                    retry_after=_parse_retry_after(retry_after),
                 )
                 
-            # Handle validation errors
-            if status_code == 400:
-                handle_video_extension_error(error_data)
-                
             # Handle server errors
             if 500 <= status_code < 600:
                 raise VideoExtensionServerError(
@@ -319,17 +474,29 @@ class VideoExtensionAPI:
                     status_code=status_code,
                 )
                 
-            # For other errors, use the generic error handler
+            # Everything else, 400 included, is mapped from the error body
             handle_video_extension_error(error_data)
             
         except httpx.RequestError as e:
-            logger.error(f"Request failed: {e}")
+            logger.error("Request failed: %s", e)
             raise VideoExtensionError(f"Request failed: {e}") from e
             
         except Exception as e:
-            logger.error(f"Unexpected error: {e}", exc_info=True)
+            logger.error("Unexpected error: %s", e, exc_info=True)
             raise VideoExtensionError(f"Unexpected error: {e}") from e
 
 
-# Singleton instance
-video_extension_api = VideoExtensionAPI(KlingClient.get_instance()._client)
+def get_video_extension_api(client: KlingClient) -> VideoExtensionAPI:
+    """Return the VideoExtensionAPI bound to ``client``'s connection pool.
+
+    The API is built on first use and cached on the client, so importing
+    this module constructs nothing. The HTTP client belongs to KlingClient;
+    close it with ``KlingClient.close()``.
+
+    Args:
+        client: Shared KlingClient whose HTTP client the API uses
+
+    Returns:
+        The client's video extension API
+    """
+    return client.video_extension
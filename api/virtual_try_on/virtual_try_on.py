@@ -5,7 +5,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+import random
+import time
+from typing import Any, Iterable, overload
 
 from pydantic import ValidationError
 
@@ -25,6 +27,16 @@ from ._responses import TaskListResponse, TaskResponse, VirtualTryOnTaskResponse
 
 logger = logging.getLogger(__name__)
 
+_SUCCEEDED = "succeed"
+_FAILED = "failed"
+_TERMINAL_STATUSES = frozenset({_SUCCEEDED, _FAILED})
+
+
+def _status_value(task_status: Any) -> str:
+    """Normalise a task status (enum member or raw string) to its lowercase value."""
+    return getattr(task_status, "value", task_status).lower()
+
+
 class VirtualTryOnAPI:
     """Client for Kling AI Virtual Try-On API.
     
@@ -40,6 +52,10 @@ class VirtualTryOnAPI:
         """
         self._client = client
         self._base_path = "/v1/images/kolors-virtual-try-on"
+        # task_id -> (monotonic fetch time, response) for non-terminal tasks
+        self._status_cache: dict[str, tuple[float, TaskResponse]] = {}
+        # task_id -> status request currently in flight, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Future[TaskResponse]] = {}
     
     async def create_task(
         self,
@@ -80,7 +96,7 @@ class VirtualTryOnAPI:
             response = await self._client._request(
                 "POST",
                 self._base_path,
-                json=request_data.model_dump(exclude_none=True),
+                content=request_data.model_dump_json(exclude_none=True),
             )
             
             # Parse and return response
@@ -103,11 +119,17 @@ class VirtualTryOnAPI:
                 raise
             raise APIError(f"Failed to create virtual try-on task: {str(e)}") from e
     
-    async def get_task_status(self, task_id: str) -> TaskResponse:
+    async def get_task_status(self, task_id: str, *, ttl_ms: int = 0) -> TaskResponse:
         """Get the status of a virtual try-on task.
 
+        Concurrent calls for the same ``task_id`` share a single in-flight
+        request.
+
         Args:
             task_id: The ID of the task to check.
+            ttl_ms: If positive, return the last fetched status for this task
+                when it is younger than this many milliseconds. Tasks that
+                reached a terminal state are never served from the cache.
 
         Returns:
             TaskResponse containing the task status and results if available.
@@ -115,6 +137,21 @@ class VirtualTryOnAPI:
         Raises:
             APIError: If the API returns an error.
         """
+        if ttl_ms > 0:
+            cached = self._status_cache.get(task_id)
+            if cached is not None and (time.monotonic() - cached[0]) * 1000 < ttl_ms:
+                return cached[1]
+        
+        inflight = self._inflight.get(task_id)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_task_status(task_id))
+            self._inflight[task_id] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(task_id, None))
+        # Shielded so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(inflight)
+    
+    async def _fetch_task_status(self, task_id: str) -> TaskResponse:
+        """Fetch a task's status and update the cache; see :meth:`get_task_status`."""
         try:
             response = await self._client._request(
                 "GET",
@@ -129,6 +166,13 @@ class VirtualTryOnAPI:
                     request_id=task_response.request_id,
                 )
             
+            # Stamp after the request completes so the entry's age excludes
+            # network time; drop finished tasks so completion is never masked
+            if _status_value(task_response.data.task_status) in _TERMINAL_STATUSES:
+                self._status_cache.pop(task_id, None)
+            else:
+                self._status_cache[task_id] = (time.monotonic(), task_response)
+            
             return task_response
             
         except Exception as e:
@@ -137,6 +181,50 @@ class VirtualTryOnAPI:
                 raise
             raise APIError(f"Failed to get task status: {str(e)}") from e
     
+    async def get_tasks_status(
+        self,
+        task_ids: Iterable[str],
+        *,
+        concurrency: int = 16,
+        return_exceptions: bool = False,
+    ) -> dict[str, TaskResponse | BaseException]:
+        """Get the status of several virtual try-on tasks concurrently.
+
+        The API has no batch status endpoint, so this fans out over
+        :meth:`get_task_status` with at most ``concurrency`` requests in
+        flight, taking roughly N / concurrency round trips instead of N.
+
+        Args:
+            task_ids: The IDs of the tasks to check. Duplicates are queried once.
+            concurrency: Maximum number of status requests in flight at once.
+            return_exceptions: If True, a failed lookup is stored in the result
+                under its task ID instead of being raised.
+
+        Returns:
+            Mapping of task ID to its TaskResponse (or exception), in the order
+            the IDs were given.
+
+        Raises:
+            ValidationError: If ``concurrency`` is less than 1.
+            APIError: If any lookup fails and ``return_exceptions`` is False.
+        """
+        if concurrency < 1:
+            raise ClientValidationError(f"concurrency must be at least 1, got {concurrency}")
+        ids = list(dict.fromkeys(task_ids))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(task_id: str) -> TaskResponse:
+            async with semaphore:
+                return await self.get_task_status(task_id)
+
+        # Let every lookup finish so one failure doesn't cancel the rest
+        results = await asyncio.gather(*(fetch(task_id) for task_id in ids), return_exceptions=True)
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        return dict(zip(ids, results))
+    
     async def list_tasks(
         self,
         *,
@@ -180,54 +268,146 @@ class VirtualTryOnAPI:
                 raise
             raise APIError(f"Failed to list tasks: {str(e)}") from e
     
+    @overload
     async def wait_for_completion(
         self,
         task_id: str,
         *,
-        poll_interval: float = 5.0,
+        poll_interval: float | None = ...,
+        min_interval: float = ...,
+        max_interval: float = ...,
+        backoff_factor: float = ...,
+        timeout: float | None = ...,
+    ) -> TaskResponse: ...
+
+    @overload
+    async def wait_for_completion(
+        self,
+        task_id: list[str],
+        *,
+        poll_interval: float | None = ...,
+        min_interval: float = ...,
+        max_interval: float = ...,
+        backoff_factor: float = ...,
+        timeout: float | None = ...,
+    ) -> dict[str, TaskResponse]: ...
+
+    async def wait_for_completion(
+        self,
+        task_id: str | list[str],
+        *,
+        poll_interval: float | None = None,
+        min_interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff_factor: float = 2.0,
         timeout: float | None = 300.0,
-    ) -> TaskResponse:
-        """Wait for a virtual try-on task to complete.
+    ) -> TaskResponse | dict[str, TaskResponse]:
+        """Wait for one or more virtual try-on tasks to complete.
+
+        Polls with exponential backoff and full jitter: the delay bound starts
+        at ``min_interval``, grows by ``backoff_factor`` while no status has
+        changed and resets when one does, and each sleep is drawn uniformly
+        from ``[0, bound]``. When given a list, all still-pending tasks are
+        checked together each round via :meth:`get_tasks_status`.
 
         Args:
-            task_id: The ID of the task to wait for.
-            poll_interval: Time in seconds between status checks.
+            task_id: The ID of the task to wait for, or a list of task IDs.
+            poll_interval: Deprecated alias for ``max_interval``.
+            min_interval: Initial delay bound in seconds.
+            max_interval: Upper bound in seconds on the delay between checks.
+            backoff_factor: Multiplier applied to the delay bound per unchanged poll.
             timeout: Maximum time in seconds to wait for completion.
 
         Returns:
-            TaskResponse with the final status and results.
+            TaskResponse with the final status and results, or for a list of
+            IDs a mapping of each task ID to its final TaskResponse.
 
         Raises:
-            TimeoutError: If the task doesn't complete before the timeout.
-            TaskFailedError: If the task fails.
+            TimeoutError: If the tasks don't complete before the timeout.
+            TaskFailedError: If any task fails.
             APIError: For other API errors.
         """
-        start_time = asyncio.get_event_loop().time()
+        if poll_interval is not None:
+            max_interval = poll_interval
+        single = isinstance(task_id, str)
+        task_ids = [task_id] if single else list(dict.fromkeys(task_id))
+        pending: dict[str, str | None] = dict.fromkeys(task_ids)
+        completed: dict[str, TaskResponse] = {}
+        try:
+            await asyncio.wait_for(
+                self._poll_until_done(
+                    pending,
+                    completed,
+                    min_interval=min_interval,
+                    max_interval=max_interval,
+                    backoff_factor=backoff_factor,
+                ),
+                timeout,
+            )
+        except asyncio.TimeoutError as exc:
+            raise TimeoutError(
+                f"Task {task_id if single else ', '.join(pending)} "
+                f"did not complete within {timeout} seconds"
+            ) from exc
+        if single:
+            return completed[task_id]
+        return {tid: completed[tid] for tid in task_ids}
+    
+    async def _poll_until_done(
+        self,
+        pending: dict[str, str | None],
+        completed: dict[str, TaskResponse],
+        *,
+        min_interval: float,
+        max_interval: float,
+        backoff_factor: float,
+    ) -> None:
+        """Poll tasks until all succeed; see :meth:`wait_for_completion`.
+
+        ``pending`` maps each unfinished task ID to its last seen status and
+        ``completed`` collects final responses; both are updated in place so
+        the caller can report which tasks were still running on timeout.
+        """
+        delay = min_interval
+        first_poll = True
         
-        while True:
-            status = await self.get_task_status(task_id)
+        while pending:
+            if len(pending) == 1:
+                tid = next(iter(pending))
+                statuses = {tid: await self.get_task_status(tid)}
+            else:
+                statuses = await self.get_tasks_status(pending)
             
-            # Check if task is complete
-            if status.data.task_status in ("succeed", "failed"):
-                if status.data.task_status == "failed":
+            changed = False
+            for tid, status in statuses.items():
+                task_status = _status_value(status.data.task_status)
+                
+                # Check if task is complete
+                if task_status == _FAILED:
                     raise TaskFailedError(
-                        f"Task {task_id} failed",
-                        task_id=task_id,
-                        status=status.data.task_status,
+                        f"Task {tid} failed",
+                        task_id=tid,
+                        status=task_status,
                         status_message=status.data.task_status_msg,
                     )
-                return status
-            
-            # Check timeout
-            if timeout is not None:
-                elapsed = asyncio.get_event_loop().time() - start_time
-                if elapsed > timeout:
-                    raise TimeoutError(
-                        f"Task {task_id} did not complete within {timeout} seconds"
-                    )
+                if task_status == _SUCCEEDED:
+                    completed[tid] = status
+                    del pending[tid]
+                    changed = True
+                else:
+                    changed = changed or pending[tid] != task_status
+                    pending[tid] = task_status
+            
+            if not pending:
+                return
+            
+            # Poll quickly again after a transition, back off while unchanged
+            if not first_poll:
+                delay = min_interval if changed else min(max_interval, delay * backoff_factor)
+            first_poll = False
             
-            # Wait before polling again
-            await asyncio.sleep(poll_interval)
+            # Full jitter keeps concurrent pollers from synchronising
+            await asyncio.sleep(random.uniform(0, delay))
 
 
 # For backward compatibility
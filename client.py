@@ -3,31 +3,96 @@ Kling AI API client implementation.
 """
 from __future__ import annotations
 
-import json
 import logging
-from typing import Any, TypeVar
+import random
+import threading
+import weakref
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import httpx
+import orjson
 from pydantic import BaseModel, ValidationError
 from tenacity import (
-    retry,
-    retry_if_exception_type,
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
-from .api.image_to_video.image_to_video import ImageToVideoAPI
-from .api.multi_image_to_video.multi_image_to_video import MultiImageToVideoAPI
-from .api.text_to_video.text_to_video import TextToVideoAPI
-from .api.video_extension.video_extension import VideoExtensionAPI
 from .config import KlingConfig
 
+if TYPE_CHECKING:
+    from .api.image_to_video.image_to_video import ImageToVideoAPI
+    from .api.multi_image_to_video.multi_image_to_video import MultiImageToVideoAPI
+    from .api.text_to_video.text_to_video import TextToVideoAPI
+    from .api.video_extension.video_extension import VideoExtensionAPI
+
 # Type variable for generic model parsing
 T = TypeVar("T", bound=BaseModel)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# HTTP statuses worth retrying; other 4xx responses won't change on a retry
+_RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+# Statuses whose Retry-After header tells us exactly when to try again
+_RETRY_AFTER_STATUSES = frozenset({429, 503})
+# Longest wait between attempts; a longer Retry-After ends the retries instead
+_MAX_RETRY_WAIT = 10.0
+_backoff_wait = wait_random_exponential(multiplier=1, max=_MAX_RETRY_WAIT)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP-date."""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_after(exc: BaseException | None) -> float | None:
+    """Return the Retry-After delay of a 429/503 error, if it carries one."""
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code in _RETRY_AFTER_STATUSES:
+        return _parse_retry_after(exc.response.headers.get("Retry-After"))
+    return None
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Return whether a failed request attempt should be retried.
+
+    A Retry-After longer than _MAX_RETRY_WAIT is not waited out: the error
+    is raised rather than retried before the server allows it.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        if exc.response.status_code not in _RETRYABLE_STATUSES:
+            return False
+        retry_after = _retry_after(exc)
+        return retry_after is None or retry_after <= _MAX_RETRY_WAIT
+    return isinstance(exc, (httpx.NetworkError, httpx.TimeoutException))
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Wait at least Retry-After on 429/503, else use jittered backoff."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = _retry_after(exc)
+    if retry_after is not None:
+        # Jitter upwards only, never retrying before the server said to
+        return retry_after + random.uniform(0, 0.5)
+    return _backoff_wait(retry_state)
+
 
 class KlingSingletonAPIError(Exception):
     """Base exception for Kling API errors."""
@@ -39,7 +104,11 @@ class KlingSingletonAPIError(Exception):
 
 class KlingClient:
     """
-    Singleton client for interacting with the Kling AI API.
+    Client for interacting with the Kling AI API, shared per configuration.
+
+    Instantiating with the same credentials and connection settings returns
+    the existing live instance, so its connection pool is reused; a different
+    configuration gets its own instance and pool.
 
     Attributes:
         text_to_video (TextToVideoAPI): API for text-to-video generation tasks.
@@ -50,15 +119,28 @@ class KlingClient:
     Usage:
         config = KlingConfig(...)
         client = KlingClient(config)
-        # All subsequent instantiations return the same instance
+        # Instantiations with an equal config return the same instance
     """
-    _instance: KlingClient | None = None
+    # Live instances keyed on _config_key(config); dropped once unreferenced
+    _instances: weakref.WeakValueDictionary[tuple[Any, ...], KlingClient] = (
+        weakref.WeakValueDictionary()
+    )
+    _instances_lock = threading.Lock()
     _initialized: bool = False
 
     def __new__(cls, config: KlingConfig) -> KlingClient:
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+        key = cls._config_key(config)
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                cls._instances[key] = instance
+        return instance
+
+    @staticmethod
+    def _config_key(config: KlingConfig) -> tuple[Any, ...]:
+        """Return the settings that make two configs share an instance."""
+        return (config.api_key, config.base_url.rstrip("/"), config.timeout, config.max_retries)
 
     def __init__(self, config: KlingConfig):
         if self._initialized:
@@ -68,30 +150,72 @@ class KlingClient:
         self.timeout = config.timeout
         self.max_retries = config.max_retries
         self._client = self._create_http_client()
-        # Register API subclients here (add more as needed)
+        self._retryer = self._create_retryer()
+        self._initialized = True
+
+    # API subclients are imported and built on first access, so callers only
+    # pay for the APIs they use (add more as needed)
+    @cached_property
+    def text_to_video(self) -> TextToVideoAPI | None:
+        """API for text-to-video generation tasks."""
         try:
-            self.text_to_video = TextToVideoAPI(self)
-            self.multi_image_to_video = MultiImageToVideoAPI(self)
-            self.image_to_video = ImageToVideoAPI(self)
-            self.video_extension = VideoExtensionAPI(self._client)
+            from .api.text_to_video.text_to_video import TextToVideoAPI
         except ImportError as e:
-            logger.warning(f"Failed to import one or more API modules: {e}")
-            self.text_to_video = None  # Could not import TextToVideoAPI
-            self.multi_image_to_video = None  # Could not import MultiImageToVideoAPI
-            self.image_to_video = None  # Could not import ImageToVideoAPI
-            self.video_extension = None  # Could not import VideoExtensionAPI
-        # todo: Register additional subclients
-        self._initialized = True
+            logger.warning("Failed to import TextToVideoAPI: %s", e)
+            return None
+        return TextToVideoAPI(self.config)
+
+    @cached_property
+    def multi_image_to_video(self) -> MultiImageToVideoAPI | None:
+        """API for multi-image to video generation tasks."""
+        try:
+            from .api.multi_image_to_video.multi_image_to_video import MultiImageToVideoAPI
+        except ImportError as e:
+            logger.warning("Failed to import MultiImageToVideoAPI: %s", e)
+            return None
+        return MultiImageToVideoAPI(self)
+
+    @cached_property
+    def image_to_video(self) -> ImageToVideoAPI | None:
+        """API for image-to-video generation tasks."""
+        try:
+            from .api.image_to_video.image_to_video import ImageToVideoAPI
+        except ImportError as e:
+            logger.warning("Failed to import ImageToVideoAPI: %s", e)
+            return None
+        return ImageToVideoAPI(self)
+
+    @cached_property
+    def video_extension(self) -> VideoExtensionAPI | None:
+        """API for extending existing videos with AI."""
+        try:
+            from .api.video_extension.video_extension import VideoExtensionAPI
+        except ImportError as e:
+            logger.warning("Failed to import VideoExtensionAPI: %s", e)
+            return None
+        return VideoExtensionAPI(self._client)
 
     def _create_http_client(self) -> httpx.AsyncClient:
         """Create and configure an HTTP client.
 
+        The client is shared by every API subclient, so it keeps a pool of
+        persistent connections and negotiates HTTP/2 to multiplex concurrent
+        requests (e.g. parallel status polls) over a single connection. Idle
+        connections are kept for 30s so they outlive typical poll intervals,
+        and connects fail fast while reads get the configured timeout.
+
         Returns:
             Configured httpx.AsyncClient instance
         """
         return httpx.AsyncClient(
             base_url=self.base_url,
-            timeout=self.timeout,
+            timeout=httpx.Timeout(connect=5.0, read=self.timeout, write=10.0, pool=None),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+            http2=True,
             headers={
                 "Authorization": f"Bearer {self.config.api_key}",
                 "Content-Type": "application/json",
@@ -99,8 +223,33 @@ class KlingClient:
             },
         )
 
+    def _create_retryer(self) -> AsyncRetrying:
+        """Create the retry policy used by :meth:`_request`.
+
+        Network errors, timeouts and 408/429/5xx responses are retried. A
+        429 or 503 carrying a Retry-After header waits as long as the server
+        asks, or is raised straight away if that is over _MAX_RETRY_WAIT;
+        otherwise waits use full jitter (a random delay up to an
+        exponentially growing cap) so that clients rate limited at the same
+        moment don't all retry in lockstep.
+
+        Returns:
+            Configured tenacity.AsyncRetrying instance
+        """
+        return AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries + 1),
+            wait=_retry_wait,
+            retry=retry_if_exception(_is_retryable),
+            reraise=True,
+        )
+
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and any subclient that opened its own."""
+        # TextToVideoAPI keeps a separate httpx client; only close it if the
+        # subclient was actually built
+        text_to_video = self.__dict__.get("text_to_video")
+        if text_to_video is not None:
+            await text_to_video.close()
         if hasattr(self, "_client") and self._client:
             await self._client.aclose()
 
@@ -112,13 +261,6 @@ class KlingClient:
         """Async context manager exit - ensure client is closed."""
         await self.close()
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type(
-            (httpx.NetworkError, httpx.TimeoutException, httpx.HTTPStatusError)
-        ),
-    )
     async def _request(
         self,
         method: str,
@@ -144,16 +286,19 @@ class KlingClient:
         logger.debug("Making %s request to %s", method, url)
 
         try:
-            response = await self._client.request(method, url, **kwargs)
-            response.raise_for_status()
-            return response.json()
+            # Iterate a copy: the retryer keeps per-call state on itself
+            async for attempt in self._retryer.copy():
+                with attempt:
+                    response = await self._client.request(method, url, **kwargs)
+                    response.raise_for_status()
+            return orjson.loads(response.content)
 
         except httpx.HTTPStatusError as e:
             error_msg = f"HTTP error {e.response.status_code}"
             try:
-                error_data = e.response.json()
+                error_data = orjson.loads(e.response.content)
                 error_msg = error_data.get("message", error_msg)
-            except (json.JSONDecodeError, AttributeError):
+            except (orjson.JSONDecodeError, AttributeError):
                 error_msg = f"{error_msg}: {e.response.text}"
 
             logger.error(
@@ -214,14 +359,17 @@ class KlingClient:
             KlingAPIError: If the response indicates an error
             ValidationError: If response data doesn't match the model
         """
-        if response.get("code") != 0:
+        code = response.get("code")
+        if code != 0:
             raise KlingSingletonAPIError(
                 response.get("message", "Unknown error"),
-                status_code=response.get("code"),
+                status_code=code,
             )
 
+        data = response.get("data")
         try:
-            return model.parse_obj(response.get("data", {}))
+            # Only a missing or null payload is treated as empty
+            return model.model_validate({} if data is None else data)
         except ValidationError as e:
             logger.error("Failed to validate response: %s", str(e))
             raise
@@ -2,8 +2,9 @@
 Kling AI API configuration and constants.
 """
 from enum import Enum
+from typing import Literal
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator
 
 
 class KlingModelName(str, Enum):
@@ -26,6 +27,14 @@ class AspectRatio(str, Enum):
     ONE_ONE = "1:1"
 
 
+# Raw enum values as literals: request models declare these so pydantic
+# validates them with a plain lookup, while callers can still pass members.
+# Built from the enums so a value added there is accepted here too.
+KlingModelNameValue = Literal[tuple(m.value for m in KlingModelName)]
+VideoModeValue = Literal[tuple(m.value for m in VideoMode)]
+AspectRatioValue = Literal[tuple(m.value for m in AspectRatio)]
+
+
 class CameraMovementType(str, Enum):
     """Predefined camera movement types."""
     SIMPLE = "simple"
@@ -74,15 +83,6 @@ class CameraConfig(BaseModel):
         description="Zoom level (-10 to 10), negative for zoom in, positive for zoom out",
     )
 
-    @validator('*', pre=True)
-    def check_single_value_set(cls, v, values, field, **kwargs):
-        """Ensure only one camera movement parameter is set when type is simple."""
-        if field.name == 'type' and v == CameraMovementType.SIMPLE:
-            non_none = [k for k, v in values.items() if v is not None and k != 'type']
-            if len(non_none) > 1:
-                raise ValueError("Only one camera movement parameter can be set when type is 'simple'")
-        return v
-
 
 class CameraControl(BaseModel):
     """Camera control settings for video generation."""
@@ -95,6 +95,18 @@ class CameraControl(BaseModel):
         description="Camera movement configuration",
     )
 
+    @model_validator(mode="after")
+    def check_single_value_set(self) -> "CameraControl":
+        """Ensure only one camera movement parameter is set when type is simple."""
+        if self.type == CameraMovementType.SIMPLE and self.config is not None:
+            non_none = [
+                name for name in CameraConfig.model_fields
+                if getattr(self.config, name) is not None
+            ]
+            if len(non_none) > 1:
+                raise ValueError("Only one camera movement parameter can be set when type is 'simple'")
+        return self
+
 
 class KlingConfig(BaseModel):
     """Main configuration for Kling AI API client."""
@@ -0,0 +1,82 @@
+"""
+Pydantic models shared by the Kling AI video model modules.
+"""
+from __future__ import annotations
+
+import re
+from datetime import datetime, timezone
+from typing import Any
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
+from pydantic.dataclasses import dataclass
+
+# Cheap structural check used instead of HttpUrl's full URL parse
+_URL_RE = re.compile(r"^https?://[^\s]+$")
+
+# Parses timestamp strings the way a ``datetime`` field would
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+
+def _ms_to_datetime(ms: int) -> datetime:
+    """Convert a Unix timestamp in milliseconds to a UTC datetime."""
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+def _coerce_ms(v: Any) -> Any:
+    """Coerce a task timestamp to Unix milliseconds.
+
+    The API sends integer milliseconds, which pass straight through.
+    Fractional milliseconds are rounded. Strings and datetimes are accepted
+    as a ``datetime`` field would take them, with naive values read as UTC.
+    """
+    if type(v) is int:
+        return v
+    if isinstance(v, float):
+        return round(v)
+    if isinstance(v, str):
+        try:
+            v = _DATETIME_ADAPTER.validate_python(v)
+        except ValidationError as e:
+            raise ValueError(f"invalid timestamp {v!r}") from e
+    if isinstance(v, datetime):
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=timezone.utc)
+        return round(v.timestamp() * 1000)
+    return v
+
+
+@dataclass(frozen=True)
+class VideoInfo:
+    """Information about a generated video.
+
+    A frozen pydantic dataclass rather than a model: one is built per video
+    in every list response and only ever read, so it skips the field-set
+    bookkeeping of BaseModel. (``slots=True`` would need Python 3.10.)
+    """
+    id: str = Field(..., description="Generated video ID; globally unique")
+    url: str = Field(..., description="URL for the generated video")
+    duration: float = Field(..., description="Total video duration in seconds")
+
+    @field_validator('url')
+    @classmethod
+    def validate_url(cls, v: str) -> str:
+        """Check that the URL is an absolute http(s) URL without full URL parsing."""
+        if not _URL_RE.match(v):
+            raise ValueError("URL must be an absolute http(s) URL")
+        return v
+
+
+class TaskInfo(BaseModel):
+    """Information about a video generation task."""
+    external_task_id: str | None = Field(
+        None,
+        description="Custom task ID provided during task creation",
+    )
+
+
+class TaskResult(BaseModel):
+    """Result of a video generation task."""
+    videos: list[VideoInfo] = Field(
+        default_factory=list,
+        description="List of generated videos"
+    )
@@ -0,0 +1,37 @@
+"""
+Tests for the Image-to-Video models.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from app.core.third_party_integrations.kling.models.image_to_video import ImageToVideoTask
+
+
+class TestImageToVideoTask:
+    """Tests for the ImageToVideoTask model."""
+
+    def test_timestamps_parse_as_utc(self) -> None:
+        """Test millisecond timestamps become timezone-aware UTC datetimes."""
+        task = ImageToVideoTask(
+            task_id="task_1",
+            task_status="succeed",
+            task_info={},
+            created_at=1_700_000_000_000,
+            updated_at=1_700_000_000_500,
+        )
+        assert task.created_at == datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+        assert task.created_at.tzinfo is timezone.utc
+        assert task.updated_at == datetime(2023, 11, 14, 22, 13, 20, 500000, tzinfo=timezone.utc)
+
+    def test_datetime_values_pass_through(self) -> None:
+        """Test datetimes are left as given rather than converted."""
+        created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        task = ImageToVideoTask(
+            task_id="task_1",
+            task_status="submitted",
+            task_info={},
+            created_at=created,
+            updated_at=created,
+        )
+        assert task.created_at == created
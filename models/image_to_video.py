@@ -1,10 +1,10 @@
 """
 Pydantic models for the Kling AI Image-to-Video API.
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Literal
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_serializer, field_validator
 
 from app.core.third_party_integrations.kling.config import (
     CameraControl,
@@ -12,9 +12,16 @@ from app.core.third_party_integrations.kling.config import (
     VideoMode,
 )
 
+# Bound once for parse_timestamps, which runs for every task in a list response
+_fromts = datetime.fromtimestamp
+_UTC = timezone.utc
+_INV_1000 = 1e-3
+
 
 class TrajectoryPoint(BaseModel):
     """A point in a motion trajectory."""
+    model_config = ConfigDict(frozen=True)
+
     x: int = Field(..., description="X-coordinate of the trajectory point")
     y: int = Field(..., description="Y-coordinate of the trajectory point")
 
@@ -29,9 +36,16 @@ class DynamicMask(BaseModel):
         description="Sequence of points defining the motion trajectory"
     )
 
+    @field_serializer("trajectories")
+    def serialize_trajectories(self, trajectories: list[TrajectoryPoint]) -> list[dict[str, int]]:
+        """Serialize points as plain {"x", "y"} dicts, skipping the per-point model serializer."""
+        return [{"x": point.x, "y": point.y} for point in trajectories]
+
 
 class ImageToVideoRequest(BaseModel):
     """Request model for image-to-video generation."""
+    model_config = ConfigDict(use_enum_values=True, populate_by_name=True, frozen=True)
+
     model_name: KlingModelName = Field(
         KlingModelName.KLING_V1,
         alias="model_name",
@@ -91,14 +105,11 @@ class ImageToVideoRequest(BaseModel):
         description="Custom ID for tracking the task"
     )
 
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
-        populate_by_name = True
-
 
 class VideoInfo(BaseModel):
     """Information about a generated video."""
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Generated video ID; globally unique")
     url: HttpUrl = Field(..., description="URL for the generated video")
     duration: float = Field(..., description="Total video duration in seconds")
@@ -114,6 +125,8 @@ class TaskResult(BaseModel):
 
 class TaskInfo(BaseModel):
     """Information about an image-to-video task."""
+    model_config = ConfigDict(frozen=True)
+
     external_task_id: str | None = Field(None, alias="external_task_id")
 
 
@@ -136,9 +149,9 @@ class ImageToVideoTask(BaseModel):
 
     @field_validator("created_at", "updated_at", mode="before")
     def parse_timestamps(cls, v):
-        """Parse Unix timestamp in milliseconds to datetime."""
-        if isinstance(v, int | float):
-            return datetime.fromtimestamp(v / 1000)
+        """Parse Unix timestamp in milliseconds to a UTC datetime."""
+        if isinstance(v, (int, float)):
+            return _fromts(v * _INV_1000, tz=_UTC)
         return v
 
 
@@ -4,7 +4,14 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+def _check_http_url(v: str) -> str:
+    """Scheme check for URLs that don't need full parsing."""
+    if not v.startswith(("http://", "https://")):
+        raise ValueError("URL must start with http:// or https://")
+    return v
 
 
 class LipSyncStatus(str, Enum):
@@ -17,6 +24,8 @@ class LipSyncStatus(str, Enum):
 
 class LipSyncRequest(BaseModel):
     """Request model for creating a lip sync task."""
+    model_config = ConfigDict(frozen=True)
+
     video_url: str = Field(..., description="URL of the video to lip sync")
     audio_url: str = Field(..., description="URL of the audio to sync to")
     output_format: Literal["mp4", "gif"] = Field(
@@ -39,16 +48,14 @@ class LipSyncRequest(BaseModel):
     @classmethod
     def validate_urls(cls, v: str) -> str:
         """Validate that URLs are properly formatted."""
-        if not v.startswith(('http://', 'https://')):
-            raise ValueError("URL must start with http:// or https://")
-        return v
+        return _check_http_url(v)
 
 
 class LipSyncResponse(BaseModel):
     """Response model for a lip sync task."""
     task_id: str = Field(..., description="Unique identifier for the task")
     status: LipSyncStatus = Field(..., description="Current status of the task")
-    result_url: HttpUrl | None = Field(
+    result_url: str | None = Field(
         None,
         description="URL to download the result, if completed"
     )
@@ -62,3 +69,9 @@ class LipSyncResponse(BaseModel):
         default_factory=dict,
         description="Additional metadata about the task"
     )
+
+    @field_validator('result_url')
+    @classmethod
+    def validate_result_url(cls, v: str | None) -> str | None:
+        """Validate that the result URL is an http(s) URL."""
+        return v if v is None else _check_http_url(v)
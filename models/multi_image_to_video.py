@@ -8,9 +8,21 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Literal
+from functools import cached_property
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing_extensions import TypedDict
+
+from ._common import TaskInfo, TaskResult, VideoInfo, _URL_RE, _coerce_ms, _ms_to_datetime
+
+_B64_PREFIXES = frozenset({
+    'data:image/png;base64,',
+    'data:image/jpeg;base64,',
+    'data:image/webp;base64,',
+})
+# Prefix lengths to slice at, so the check never scans a large payload
+_B64_PREFIX_LENGTHS = tuple(sorted({len(prefix) for prefix in _B64_PREFIXES}))
 
 
 class MultiImageToVideoMode(str, Enum):
@@ -28,7 +40,7 @@ class MultiImageToVideoAspectRatio(str, Enum):
 
 class ImageItem(BaseModel):
     """Model representing a single image input for multi-image to video."""
-    url: HttpUrl | None = Field(
+    url: str | None = Field(
         None,
         description="URL of the image (must be publicly accessible)",
     )
@@ -40,48 +52,30 @@ class ImageItem(BaseModel):
         ),
     )
 
-    @field_validator('base64', mode='before')
-    def validate_image_data(cls, v):
-        """Validate that either URL or base64 is provided, but not both."""
-        if v is not None and not v.startswith(('data:image/png;base64,', 'data:image/jpeg;base64,', 'data:image/webp;base64,')):
-            raise ValueError("base64 must start with 'data:image/{png,jpeg,webp};base64,'")
-        return v
-
-    @field_validator('url', mode='before')
-    def validate_url_or_base64(cls, v, values):
-        """Validate that either URL or base64 is provided, but not both."""
-        if v is not None and values.get('base64') is not None:
+    @model_validator(mode='before')
+    @classmethod
+    def validate_image_source(cls, data: Any) -> Any:
+        """Validate that exactly one of URL or base64 is provided, and its format."""
+        if not isinstance(data, dict):
+            return data
+        url, b64 = data.get('url'), data.get('base64')
+        if url is not None and b64 is not None:
             raise ValueError("Cannot specify both 'url' and 'base64'")
-        if v is None and values.get('base64') is None:
+        if url is None and b64 is None:
             raise ValueError("Either 'url' or 'base64' must be provided")
-        return v
-
-
-class VideoInfo(BaseModel):
-    """Information about a generated video."""
-    id: str = Field(..., description="Generated video ID; globally unique")
-    url: HttpUrl = Field(..., description="URL for the generated video")
-    duration: float = Field(..., description="Total video duration in seconds")
-
-
-class TaskInfo(BaseModel):
-    """Additional information about a multi-image to video task."""
-    external_task_id: str | None = Field(
-        None,
-        description="Custom task ID provided during task creation",
-    )
-
-
-class TaskResult(BaseModel):
-    """Result of a multi-image to video task."""
-    videos: list[VideoInfo] = Field(
-        default_factory=list,
-        description="List of generated videos"
-    )
+        if isinstance(b64, str) and not any(
+            b64[:length] in _B64_PREFIXES for length in _B64_PREFIX_LENGTHS
+        ):
+            raise ValueError("base64 must start with 'data:image/{png,jpeg,webp};base64,'")
+        if isinstance(url, str) and not _URL_RE.match(url):
+            raise ValueError("URL must be an absolute http(s) URL")
+        return data
 
 
 class MultiImageToVideoTask(BaseModel):
     """Multi-image to video task details."""
+    model_config = ConfigDict(defer_build=True)
+
     task_id: str = Field(..., description="Unique task identifier")
     task_status: Literal["submitted", "processing", "succeed", "failed"] = Field(
         ...,
@@ -96,28 +90,39 @@ class MultiImageToVideoTask(BaseModel):
         None,
         description="Task result, available when task is completed",
     )
-    created_at: datetime = Field(..., description="Task creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    created_at: int = Field(..., description="Task creation time, Unix ms")
+    updated_at: int = Field(..., description="Last update time, Unix ms")
 
     @field_validator('created_at', 'updated_at', mode='before')
-    def parse_timestamps(cls, v):
-        """Parse Unix timestamp in milliseconds to datetime."""
-        if isinstance(v, int | float):
-            return datetime.fromtimestamp(v / 1000)
-        return v
+    @classmethod
+    def coerce_timestamps(cls, v: Any) -> Any:
+        """Accept ISO strings, datetimes and fractional values as Unix ms."""
+        return _coerce_ms(v)
+
+    @cached_property
+    def created_dt(self) -> datetime:
+        """Creation time as a UTC datetime, built on first access."""
+        return _ms_to_datetime(self.created_at)
+
+    @cached_property
+    def updated_dt(self) -> datetime:
+        """Last update time as a UTC datetime, built on first access."""
+        return _ms_to_datetime(self.updated_at)
 
 
-class MultiImageToVideoResponse(BaseModel):
+# The envelopes below are TypedDicts: pass them to a TypeAdapter and only the
+# task data is constructed as models.
+class MultiImageToVideoResponse(TypedDict):
     """Response model for multi-image to video task creation."""
-    code: int = Field(..., description="Error code (0 for success)")
-    message: str = Field(..., description="Error message")
-    request_id: str = Field(..., description="Request ID for debugging")
-    data: MultiImageToVideoTask = Field(..., description="Task details")
+    code: int  # Error code (0 for success)
+    message: str  # Error message
+    request_id: str  # Request ID for debugging
+    data: MultiImageToVideoTask
 
 
-class MultiImageToVideoListResponse(BaseModel):
+class MultiImageToVideoListResponse(TypedDict):
     """Response model for listing multi-image to video tasks."""
-    code: int = Field(..., description="Error code (0 for success)")
-    message: str = Field(..., description="Error message")
-    request_id: str = Field(..., description="Request ID for debugging")
-    data: list[MultiImageToVideoTask] = Field(..., description="List of tasks")
\ No newline at end of file
+    code: int  # Error code (0 for success)
+    message: str  # Error message
+    request_id: str  # Request ID for debugging
+    data: list[MultiImageToVideoTask]
@@ -2,33 +2,23 @@
 Pydantic models for the Kling AI Text-to-Video API.
 """
 from datetime import datetime
-from typing import Literal
+from functools import cached_property
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing_extensions import TypedDict
 
 from app.core.third_party_integrations.kling.config import (
     AspectRatio,
+    AspectRatioValue,
     CameraControl,
     KlingModelName,
+    KlingModelNameValue,
     VideoMode,
+    VideoModeValue,
 )
 
-
-class VideoInfo(BaseModel):
-    """Information about a generated video."""
-    id: str = Field(..., description="Generated video ID; globally unique")
-    url: HttpUrl = Field(..., description="URL for the generated video")
-    duration: float = Field(..., description="Total video duration in seconds")
-
-
-class TaskResult(BaseModel):
-    """Result of a text-to-video task."""
-    videos: list[VideoInfo] = Field(default_factory=list, description="List of generated videos")
-
-
-class TaskInfo(BaseModel):
-    """Information about a text-to-video task."""
-    external_task_id: str | None = Field(None, alias="external_task_id")
+from ._common import TaskInfo, TaskResult, VideoInfo, _URL_RE, _coerce_ms, _ms_to_datetime
 
 
 class TextToVideoTask(BaseModel):
@@ -41,22 +31,34 @@ class TextToVideoTask(BaseModel):
         None, alias="task_status_msg", description="Error message if task failed"
     )
     task_info: TaskInfo = Field(..., alias="task_info")
-    created_at: datetime = Field(..., alias="created_at")
-    updated_at: datetime = Field(..., alias="updated_at")
+    created_at: int = Field(..., alias="created_at", description="Creation time, Unix ms")
+    updated_at: int = Field(..., alias="updated_at", description="Last update time, Unix ms")
     task_result: TaskResult | None = Field(None, alias="task_result")
 
-    @field_validator("created_at", "updated_at", pre=True)
-    def parse_timestamps(cls, v):
-        """Parse Unix timestamp in milliseconds to datetime."""
-        if isinstance(v, int | float):
-            return datetime.fromtimestamp(v / 1000)
-        return v
+    @field_validator("created_at", "updated_at", mode="before")
+    @classmethod
+    def coerce_timestamps(cls, v: Any) -> Any:
+        """Accept ISO strings, datetimes and fractional values as Unix ms."""
+        return _coerce_ms(v)
+
+    @cached_property
+    def created_dt(self) -> datetime:
+        """Creation time as a UTC datetime, built on first access."""
+        return _ms_to_datetime(self.created_at)
+
+    @cached_property
+    def updated_dt(self) -> datetime:
+        """Last update time as a UTC datetime, built on first access."""
+        return _ms_to_datetime(self.updated_at)
 
 
 class TextToVideoRequest(BaseModel):
     """Request model for text-to-video generation."""
-    model_name: KlingModelName = Field(
-        KlingModelName.KLING_V1,
+    # Only built on the write path, so its schema is compiled on first use
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+    model_name: KlingModelNameValue = Field(
+        KlingModelName.KLING_V1.value,
         alias="model_name",
         description="Model to use for generation",
     )
@@ -73,15 +75,15 @@ class TextToVideoRequest(BaseModel):
             "more closely follow the prompt"
         ),
     )
-    mode: VideoMode = Field(
-        VideoMode.STANDARD,
+    mode: VideoModeValue = Field(
+        VideoMode.STANDARD.value,
         description="Generation mode (standard or professional)",
     )
     camera_control: CameraControl | None = Field(
         None, description="Camera movement configuration"
     )
-    aspect_ratio: AspectRatio = Field(
-        AspectRatio.SIXTEEN_NINE, description="Aspect ratio of the generated video"
+    aspect_ratio: AspectRatioValue = Field(
+        AspectRatio.SIXTEEN_NINE.value, description="Aspect ratio of the generated video"
     )
     duration: int = Field(
         5,
@@ -89,30 +91,35 @@ class TextToVideoRequest(BaseModel):
         le=10,
         description="Duration of the video in seconds (5 or 10)",
     )
-    callback_url: HttpUrl | None = Field(
+    callback_url: str | None = Field(
         None, description="Webhook URL for task completion notifications"
     )
     external_task_id: str | None = Field(
         None, description="Custom ID for tracking the task"
     )
 
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
-        allow_population_by_field_name = True
+    @field_validator('callback_url')
+    @classmethod
+    def validate_callback_url(cls, v: str | None) -> str | None:
+        """Check that the callback URL is an absolute http(s) URL."""
+        if v is not None and not _URL_RE.match(v):
+            raise ValueError("URL must be an absolute http(s) URL")
+        return v
 
 
-class TextToVideoResponse(BaseModel):
+# Response envelopes are plain TypedDicts; validating one through a TypeAdapter
+# builds only the tasks in ``data`` as models.
+class TextToVideoResponse(TypedDict):
     """Response model for text-to-video task creation."""
-    code: int = Field(..., description="Error code (0 for success)")
-    message: str = Field(..., description="Error message")
-    request_id: str = Field(..., description="Request ID for debugging")
-    data: TextToVideoTask = Field(..., description="Task details")
+    code: int  # Error code (0 for success)
+    message: str  # Error message
+    request_id: str  # Request ID for debugging
+    data: TextToVideoTask
 
 
-class TextToVideoListResponse(BaseModel):
+class TextToVideoListResponse(TypedDict):
     """Response model for listing text-to-video tasks."""
-    code: int = Field(..., description="Error code (0 for success)")
-    message: str = Field(..., description="Error message")
-    request_id: str = Field(..., description="Request ID for debugging")
-    data: list[TextToVideoTask] = Field(..., description="List of tasks")
+    code: int  # Error code (0 for success)
+    message: str  # Error message
+    request_id: str  # Request ID for debugging
+    data: list[TextToVideoTask]
@@ -2,18 +2,15 @@
 Pydantic models for the Kling AI Video Extension API.
 """
 from datetime import datetime
-from typing import Literal
+from functools import cached_property
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing_extensions import TypedDict
 
-from app.core.third_party_integrations.kling.config import KlingModelName
+from app.core.third_party_integrations.kling.config import KlingModelName, KlingModelNameValue
 
-
-class VideoInfo(BaseModel):
-    """Information about an extended video."""
-    id: str = Field(..., description="Extended video ID; globally unique")
-    url: HttpUrl = Field(..., description="URL for the extended video")
-    duration: float = Field(..., description="Total video duration in seconds")
+from ._common import TaskInfo, VideoInfo, _URL_RE, _coerce_ms, _ms_to_datetime
 
 
 class TaskResult(BaseModel):
@@ -21,11 +18,6 @@ class TaskResult(BaseModel):
     video: VideoInfo = Field(..., description="Extended video information")
 
 
-class TaskInfo(BaseModel):
-    """Information about a video extension task."""
-    external_task_id: str | None = Field(None, description="Custom ID for tracking the task")
-
-
 class VideoExtensionTask(BaseModel):
     """Video extension task details."""
     task_id: str = Field(..., description="Unique task ID")
@@ -37,16 +29,24 @@ class VideoExtensionTask(BaseModel):
     )
     task_info: TaskInfo = Field(..., description="Task metadata")
     task_result: TaskResult | None = Field(None, description="Task result when completed")
-    created_at: datetime = Field(..., description="Task creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    created_at: int = Field(..., description="Task creation time, Unix ms")
+    updated_at: int = Field(..., description="Last update time, Unix ms")
 
     @field_validator("created_at", "updated_at", mode="before")
     @classmethod
-    def parse_timestamps(cls, v):
-        """Parse Unix timestamp in milliseconds to datetime."""
-        if isinstance(v, (int, float)):
-            return datetime.fromtimestamp(v / 1000)
-        return v
+    def coerce_timestamps(cls, v: Any) -> Any:
+        """Accept ISO strings, datetimes and fractional values as Unix ms."""
+        return _coerce_ms(v)
+
+    @cached_property
+    def created_dt(self) -> datetime:
+        """Creation time as a UTC datetime, built on first access."""
+        return _ms_to_datetime(self.created_at)
+
+    @cached_property
+    def updated_dt(self) -> datetime:
+        """Last update time as a UTC datetime, built on first access."""
+        return _ms_to_datetime(self.updated_at)
 
 
 class VideoExtensionRequest(BaseModel):
@@ -61,8 +61,11 @@ class VideoExtensionRequest(BaseModel):
         callback_url: Webhook URL for task completion notifications
         external_task_id: Custom ID for tracking the task
     """
-    model_name: KlingModelName = Field(
-        KlingModelName.KLING_V1,
+    # Only built on the write path, so its schema is compiled on first use
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+    model_name: KlingModelNameValue = Field(
+        KlingModelName.KLING_V1.value,
         description="Model to use for generation",
     )
     video_id: str = Field(..., description="ID of the video to extend")
@@ -85,16 +88,20 @@ class VideoExtensionRequest(BaseModel):
             "more closely follow the prompt"
         ),
     )
-    callback_url: HttpUrl | None = Field(
+    callback_url: str | None = Field(
         None, description="Webhook URL for task completion notifications"
     )
     external_task_id: str | None = Field(
         None, description="Custom ID for tracking the task"
     )
 
-    class Config:
-        use_enum_values = True
-        allow_population_by_field_name = True
+    @field_validator('callback_url')
+    @classmethod
+    def validate_callback_url(cls, v: str | None) -> str | None:
+        """Check that the callback URL is an absolute http(s) URL."""
+        if v is not None and not _URL_RE.match(v):
+            raise ValueError("URL must be an absolute http(s) URL")
+        return v
 
 
 class VideoExtensionResponse(BaseModel):
@@ -105,9 +112,12 @@ class VideoExtensionResponse(BaseModel):
     data: VideoExtensionTask = Field(..., description="Task details")
 
 
-class VideoExtensionListResponse(BaseModel):
+# Unlike the creation response above, which VideoExtensionAPI returns as a
+# model, the list envelope is a TypedDict so that validating it through a
+# TypeAdapter only builds the tasks in ``data`` as models.
+class VideoExtensionListResponse(TypedDict):
     """Response model for listing video extension tasks."""
-    code: int = Field(..., description="Error code (0 for success)")
-    message: str = Field(..., description="Error message")
-    request_id: str = Field(..., description="Request ID for debugging")
-    data: list[VideoExtensionTask] = Field(..., description="List of tasks")
+    code: int  # Error code (0 for success)
+    message: str  # Error message
+    request_id: str  # Request ID for debugging
+    data: list[VideoExtensionTask]